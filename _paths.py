@@ -0,0 +1,83 @@
+"""
+Paths and helpers shared by the helper scripts in the repository root.
+
+Computed once at import time so that spawning a server does not repeat
+the cwd lookup and path joins on every connection.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+SRC_DIR = str(Path(__file__).resolve().parent / "src")
+PYTHONPATH_ENV = SRC_DIR + os.pathsep + os.environ.get("PYTHONPATH", "")
+
+# Environment for spawned servers, built once rather than per connection
+SERVER_ENV = {**os.environ, "PYTHONPATH": PYTHONPATH_ENV}
+
+try:
+    import orjson
+
+    dumps = orjson.dumps
+    loads = orjson.loads
+
+    def encode_frame(obj):
+        """Encode a JSON-RPC message as one newline-terminated frame."""
+        # orjson appends the newline itself, so no second buffer is built
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+
+    def dumps_pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:  # orjson is an optional speedup
+    import json
+
+    loads = json.loads
+
+    def dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def encode_frame(obj):
+        """Encode a JSON-RPC message as one newline-terminated frame."""
+        return (json.dumps(obj, separators=(",", ":")) + "\n").encode()
+
+    def dumps_pretty(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+
+
+def run(main):
+    """Run a coroutine to completion, on uvloop when it is installed.
+
+    The event loop is only imported here, so scripts that never run one
+    do not pay for importing it.
+    """
+    try:
+        import uvloop
+    except ImportError:  # uvloop is an optional speedup
+        import asyncio
+
+        return asyncio.run(main)
+    return uvloop.run(main)
+
+
+def usage_error(usage, message):
+    """Report a command-line error the way argparse does and exit with status 2."""
+    prog = os.path.basename(sys.argv[0])
+    sys.stderr.write(f"{usage.splitlines()[0]}\n{prog}: error: {message}\n")
+    sys.exit(2)
+
+
+def parse_args(usage, choices):
+    """Check the command line against a fixed set of arguments.
+
+    Behaves like argparse for the few flags the helper scripts take,
+    without importing it: -h/--help prints the usage and exits with
+    status 0, and anything not in choices is an error.
+    """
+    args = sys.argv[1:]
+    if "-h" in args or "--help" in args:
+        print(usage)
+        sys.exit(0)
+    unknown = [arg for arg in args if arg not in choices]
+    if unknown:
+        usage_error(usage, f"unrecognized arguments: {' '.join(unknown)}")
+    return args
@@ -10,58 +10,160 @@ import asyncio
 import json
 import os
 import sys
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
-from pathlib import Path
+
+from _paths import SERVER_ENV, encode_frame, loads, parse_args, run
+
+# Frames that never change are encoded once; only the request id varies
+_INIT_FRAME_TEMPLATE = (
+    b'{"jsonrpc":"2.0","id":%d,"method":"initialize","params":{'
+    b'"protocolVersion":"2024-11-05","capabilities":{"tools":{}},'
+    b'"clientInfo":{"name":"mcp-client","version":"1.0.0"}}}\n'
+)
+_INITIALIZED_NOTIFY = b'{"jsonrpc":"2.0","method":"notifications/initialized","params":{}}\n'
+_TOOLS_LIST_FRAME_TEMPLATE = b'{"jsonrpc":"2.0","id":%d,"method":"tools/list","params":{}}\n'
 
 
 @dataclass
 class MCPResponse:
     """Represents an MCP response."""
     success: bool
-    data: Any
+    data: Any = None
     error: Optional[str] = None
 
 
+class MCPProtocol(asyncio.SubprocessProtocol):
+    """Subprocess protocol that frames server stdout into JSON-RPC messages.
+
+    Pipe data is accumulated in a bytearray and split on newlines as it
+    arrives; each frame resolves the pending request future with the same
+    id, so responses never pass through a StreamReader.
+    """
+
+    def __init__(self, pending: Dict[int, asyncio.Future], echo_stderr: bool = False):
+        loop = asyncio.get_running_loop()
+        self._pending = pending
+        self._echo_stderr = echo_stderr
+        self._buffer = bytearray()
+        self._paused = False
+        self._drain_waiters: List[asyncio.Future] = []
+        self.closed = loop.create_future()
+
+    def pipe_data_received(self, fd: int, data: bytes):
+        """Split stdout data into frames and echo stderr when requested."""
+        if fd == 2 and self._echo_stderr:
+            sys.stderr.write(data.decode(errors="replace"))
+        if fd != 1:
+            return
+
+        buffer = self._buffer
+        buffer += data
+        start = 0
+        while (end := buffer.find(b"\n", start)) != -1:
+            self._dispatch(buffer[start:end])
+            start = end + 1
+        del buffer[:start]
+
+    def _dispatch(self, frame: bytearray):
+        """Resolve the pending request a frame answers."""
+        try:
+            message = loads(frame)
+        except ValueError:
+            return
+
+        future = self._pending.pop(message.get("id"), None)
+        if future is not None and not future.done():
+            future.set_result(message)
+
+    def pipe_connection_lost(self, fd: int, exc: Optional[Exception]):
+        """Fail outstanding requests once stdout closes."""
+        if fd != 1:
+            return
+
+        # The server is gone; fail outstanding requests now rather than
+        # letting each one run into its timeout
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError("Server closed the connection"))
+        self._pending.clear()
+
+    def connection_lost(self, exc: Optional[Exception]):
+        """Mark the connection closed once the process and pipes are done."""
+        self._wake_drain_waiters(ConnectionResetError("Connection lost"))
+        if not self.closed.done():
+            self.closed.set_result(None)
+
+    def pause_writing(self):
+        """Stop writers while the stdin pipe buffer is full."""
+        self._paused = True
+
+    def resume_writing(self):
+        """Release writers once the stdin pipe buffer has drained."""
+        self._paused = False
+        self._wake_drain_waiters()
+
+    def _wake_drain_waiters(self, exc: Optional[Exception] = None):
+        """Resolve (or fail) every coroutine waiting in drain()."""
+        for waiter in self._drain_waiters:
+            if not waiter.done():
+                if exc is None:
+                    waiter.set_result(None)
+                else:
+                    waiter.set_exception(exc)
+        self._drain_waiters.clear()
+
+    async def drain(self):
+        """Wait until the stdin pipe is ready for more data."""
+        if not self._paused:
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._drain_waiters.append(waiter)
+        await waiter
+
+
 class MCPClient:
     """MCP client that spawns its own server connection."""
 
     def __init__(self):
         """Initialize the MCP client."""
-        self.process = None
         self.request_id = 0
         self.connected = False
+        self._debug = os.environ.get("MCP_CLIENT_DEBUG") == "1"
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._transport: Optional[asyncio.SubprocessTransport] = None
+        self._protocol: Optional[MCPProtocol] = None
+        self._stdin: Optional[asyncio.WriteTransport] = None
+        self._deferred_writes = bytearray()
 
     async def connect(self) -> bool:
         """Connect by spawning a server process."""
         try:
-            # Setup environment
-            env = os.environ.copy()
-            env["PYTHONPATH"] = f"{Path.cwd() / 'src'}:{env.get('PYTHONPATH', '')}"
-
             print("🔌 Connecting to MCP server...")
 
             # Spawn server process
-            self.process = await asyncio.create_subprocess_exec(
+            loop = asyncio.get_running_loop()
+            self._transport, self._protocol = await loop.subprocess_exec(
+                lambda: MCPProtocol(self._pending, echo_stderr=self._debug),
                 sys.executable, "-m", "mcp_script_runner.server",
                 stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                env=env
+                # Without debugging nobody reads server stderr, so skip the pipe
+                stderr=asyncio.subprocess.PIPE if self._debug else asyncio.subprocess.DEVNULL,
+                env=SERVER_ENV
             )
+            self._stdin = self._transport.get_pipe_transport(0)
 
-            await asyncio.sleep(0.5)
-
-            if self.process.returncode is not None:
-                print("❌ Failed to spawn server process")
-                return False
-
-            # Initialize the connection
+            # Initialize right away; the first response doubles as the
+            # readiness signal, so there is no fixed startup wait.
             init_response = await self.initialize()
             if init_response.success:
                 self.connected = True
                 print("✅ Connected to MCP server")
                 return True
+            elif not self._is_alive():
+                print("❌ Failed to spawn server process")
+                return False
             else:
                 print(f"❌ Failed to initialize connection: {init_response.error}")
                 return False
@@ -72,15 +174,30 @@ class MCPClient:
 
     async def disconnect(self):
         """Disconnect from the MCP server."""
-        if self.process:
+        if self._transport:
             try:
-                self.process.terminate()
-                await self.process.wait()
+                self._transport.terminate()
+                await self._protocol.closed
+                self._transport.close()
                 self.connected = False
                 print("🔌 Disconnected from MCP server")
             except Exception as e:
                 print(f"⚠️ Error during disconnect: {e}")
 
+    def _write(self, data: bytes):
+        """Write data to the server, flushing deferred writes ahead of it."""
+        if self._deferred_writes:
+            # Swap in a fresh buffer rather than clearing the old one; the
+            # transport may still reference it until the write completes
+            buffer, self._deferred_writes = self._deferred_writes, bytearray()
+            buffer += data
+            data = buffer
+        self._stdin.write(data)
+
+    def _is_alive(self) -> bool:
+        """Check whether the spawned server process is still running."""
+        return self._transport is not None and self._transport.get_returncode() is None
+
     def _get_next_request_id(self) -> int:
         """Get the next request ID."""
         self.request_id += 1
@@ -88,44 +205,115 @@ class MCPClient:
 
     async def send_request(self, method: str, params: Dict[str, Any] = None) -> MCPResponse:
         """Send an MCP request to the server."""
-        if not self.process or self.process.returncode is not None:
-            return MCPResponse(success=False, error="Not connected to server")
-
         request = {
             "jsonrpc": "2.0",
             "id": self._get_next_request_id(),
             "method": method,
             "params": params or {}
         }
-        print(f"Sending request: {json.dumps(request) }")
-        try:
-            request_json = json.dumps(request) + "\n"
-            self.process.stdin.write(request_json.encode())
-            await self.process.stdin.drain()
+        return await self._send_frame(request["id"], method, encode_frame(request))
 
-            response_line = await asyncio.wait_for(self.process.stdout.readline(), timeout=5.0)
-            if not response_line:
-                return MCPResponse(success=False, error="No response from server")
-
-            response_data = json.loads(response_line.decode().strip())
+    async def _send_frame(self, request_id: int, method: str, frame: bytes) -> MCPResponse:
+        """Write an encoded request frame and wait for its response."""
+        if not self._is_alive():
+            return MCPResponse(success=False, error="Not connected to server")
 
-            if "error" in response_data:
-                return MCPResponse(
-                    success=False,
-                    data=response_data,
-                    error=response_data["error"].get("message", "Unknown error")
-                )
+        if self._debug:
+            sys.stderr.write(f"→ {method} (id {request_id})\n")
 
-            return MCPResponse(success=True, data=response_data.get("result"))
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            self._write(frame)
+            await self._protocol.drain()
+        except Exception as e:
+            self._pending.pop(request_id, None)
+            return MCPResponse(success=False, error=f"Request failed: {e}")
 
+        return await self._wait_for_response(request_id, future)
+
+    async def send_requests_batch(
+        self,
+        requests: List[Tuple[str, Optional[Dict[str, Any]]]]
+    ) -> Dict[int, MCPResponse]:
+        """Send several MCP requests in a single write.
+
+        Responses are matched back to their requests by id, so the server
+        is free to answer them in any order.
+
+        Args:
+            requests: List of (method, params) pairs
+
+        Returns:
+            Dictionary mapping request id to MCPResponse, in request order
+        """
+        loop = asyncio.get_running_loop()
+        buffer = bytearray()
+        futures: Dict[int, asyncio.Future] = {}
+
+        for method, params in requests:
+            request = {
+                "jsonrpc": "2.0",
+                "id": self._get_next_request_id(),
+                "method": method,
+                "params": params or {}
+            }
+            if self._debug:
+                sys.stderr.write(f"→ {method} (id {request['id']})\n")
+            buffer += encode_frame(request)
+            futures[request["id"]] = loop.create_future()
+
+        if not self._is_alive():
+            return {
+                request_id: MCPResponse(success=False, error="Not connected to server")
+                for request_id in futures
+            }
+
+        self._pending.update(futures)
+        try:
+            self._write(buffer)
+            await self._protocol.drain()
+        except Exception as e:
+            for request_id in futures:
+                self._pending.pop(request_id, None)
+            return {
+                request_id: MCPResponse(success=False, error=f"Request failed: {e}")
+                for request_id in futures
+            }
+
+        # Wait on every response at once so the timeouts overlap rather
+        # than adding up when the server stalls
+        async with asyncio.TaskGroup() as tg:
+            tasks = {
+                request_id: tg.create_task(self._wait_for_response(request_id, future))
+                for request_id, future in futures.items()
+            }
+
+        return {request_id: task.result() for request_id, task in tasks.items()}
+
+    async def _wait_for_response(self, request_id: int, future: asyncio.Future) -> MCPResponse:
+        """Wait for the protocol to resolve a pending request."""
+        try:
+            response_data = await asyncio.wait_for(future, timeout=5.0)
         except asyncio.TimeoutError:
             return MCPResponse(success=False, error="Request timeout")
-        except Exception as e:
-            return MCPResponse(success=False, error=f"Request failed: {e}")
+        except ConnectionError:
+            return MCPResponse(success=False, error="No response from server")
+        finally:
+            self._pending.pop(request_id, None)
+
+        if "error" in response_data:
+            return MCPResponse(
+                success=False,
+                data=response_data,
+                error=response_data["error"].get("message", "Unknown error")
+            )
+
+        return MCPResponse(success=True, data=response_data.get("result"))
 
     async def send_notification(self, method: str, params: Dict[str, Any] = None):
         """Send an MCP notification (no response expected)."""
-        if not self.process or self.process.returncode is not None:
+        if not self._is_alive():
             return
 
         notification = {
@@ -135,30 +323,30 @@ class MCPClient:
         }
 
         try:
-            notification_json = json.dumps(notification) + "\n"
-            print(f"Sending notification: {notification_json}")
-            self.process.stdin.write(notification_json.encode())
-            await self.process.stdin.drain()
+            self._write(encode_frame(notification))
+            await self._protocol.drain()
         except Exception as e:
             print(f"Warning: Failed to send notification {method}: {e}")
 
     async def initialize(self) -> MCPResponse:
         """Initialize the MCP connection."""
-        response = await self.send_request("initialize", {
-            "protocolVersion": "2024-11-05",
-            "capabilities": {"tools": {}},
-            "clientInfo": {"name": "mcp-client", "version": "1.0.0"}
-        })
-        print(f"Initialize response: {response}")
+        request_id = self._get_next_request_id()
+        response = await self._send_frame(
+            request_id, "initialize", _INIT_FRAME_TEMPLATE % request_id
+        )
         if response.success:
-            # Send required initialized notification
-            await self.send_notification("notifications/initialized")
+            # The required initialized notification rides along with the
+            # next outbound write instead of costing a write of its own
+            self._deferred_writes += _INITIALIZED_NOTIFY
 
         return response
 
     async def list_tools(self) -> MCPResponse:
         """List available tools."""
-        return await self.send_request("tools/list")
+        request_id = self._get_next_request_id()
+        return await self._send_frame(
+            request_id, "tools/list", _TOOLS_LIST_FRAME_TEMPLATE % request_id
+        )
 
     async def call_tool(self, name: str, arguments: Dict[str, Any] = None) -> MCPResponse:
         """Call a tool."""
@@ -168,100 +356,161 @@ class MCPClient:
         })
 
 
+_shared_client: Optional[MCPClient] = None
+
+
+async def get_client() -> Optional[MCPClient]:
+    """Get a connected client shared by every caller in this process.
+
+    The server is spawned on first use and reused afterwards, so repeated
+    test runs pay the server startup cost only once.
+
+    Returns:
+        Connected MCPClient, or None if the connection failed
+    """
+    global _shared_client
+    if _shared_client is None or not _shared_client._is_alive():
+        if _shared_client is not None:
+            # The server has exited; release its pipes before replacing it
+            _shared_client._transport.close()
+            _shared_client = None
+        client = MCPClient()
+        if not await client.connect():
+            await client.disconnect()
+            return None
+        _shared_client = client
+    return _shared_client
+
+
+async def close_shared_client():
+    """Disconnect the shared client, if one has been created."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.disconnect()
+        _shared_client = None
+
+
 async def run_tests(client: MCPClient):
     """Run basic tests."""
-    print("\n🧪 Running Tests")
-    print("=" * 30)
+    sys.stdout.write("\n🧪 Running Tests\n" + "=" * 30 + "\n")
+    sys.stdout.flush()
 
+    # Collect the report and write it once instead of a print() per line
+    lines = []
     tests_passed = 0
     tests_total = 0
 
+    # The probes are independent, so pipeline them in a single write and
+    # let the protocol match the responses by id
+    tools_response, directory_response, scripts_response, run_response = (
+        await client.send_requests_batch([
+            ("tools/list", None),
+            ("tools/call", {"name": "get_working_directory", "arguments": {}}),
+            ("tools/call", {"name": "list_scripts", "arguments": {}}),
+            ("tools/call", {
+                "name": "run_script",
+                "arguments": {"script_name": "hello", "arguments": []}
+            }),
+        ])
+    ).values()
+
     # Test 1: List tools
     tests_total += 1
-    print("🛠️ Testing tool discovery...")
-    response = await client.list_tools()
+    lines.append("🛠️ Testing tool discovery...")
+    response = tools_response
     if response.success:
         tools = response.data.get("tools", [])
-        print(f"✅ Found {len(tools)} tools: {', '.join([t['name'] for t in tools])}")
+        lines.append(f"✅ Found {len(tools)} tools: {', '.join([t['name'] for t in tools])}")
         tests_passed += 1
     else:
-        print(f"❌ Tool discovery failed: {response.error}")
+        lines.append(f"❌ Tool discovery failed: {response.error}")
 
     # Test 2: Get working directory
     tests_total += 1
-    print("\n📁 Testing working directory...")
-    response = await client.call_tool("get_working_directory")
+    lines.append("\n📁 Testing working directory...")
+    response = directory_response
     if response.success:
         content = response.data.get("content", [])
         if content:
             directory = content[0].get("text", "N/A")
-            print(f"✅ Current directory: {directory}")
+            lines.append(f"✅ Current directory: {directory}")
             tests_passed += 1
         else:
-            print("❌ No directory information returned")
+            lines.append("❌ No directory information returned")
     else:
-        print(f"❌ Get working directory failed: {response.error}")
+        lines.append(f"❌ Get working directory failed: {response.error}")
 
     # Test 3: List scripts
     tests_total += 1
-    print("\n📜 Testing script listing...")
-    response = await client.call_tool("list_scripts")
+    lines.append("\n📜 Testing script listing...")
+    response = scripts_response
     if response.success:
         content = response.data.get("content", [])
         if content:
-            scripts_text = content[0].get("text", "")
-            print(f"✅ Scripts listed successfully")
-            print(f"   Preview: {scripts_text[:100]}...")
+            preview = content[0].get("text", "")[:100]
+            lines.append(f"✅ Scripts listed successfully")
+            lines.append(f"   Preview: {preview}...")
             tests_passed += 1
         else:
-            print("❌ No scripts information returned")
+            lines.append("❌ No scripts information returned")
     else:
-        print(f"❌ List scripts failed: {response.error}")
+        lines.append(f"❌ List scripts failed: {response.error}")
 
     # Test 4: Execute hello script
     tests_total += 1
-    print("\n🎯 Testing script execution...")
-    response = await client.call_tool("run_script", {
-        "script_name": "hello",
-        "arguments": []
-    })
+    lines.append("\n🎯 Testing script execution...")
+    response = run_response
     if response.success:
         content = response.data.get("content", [])
         if content:
-            output = content[0].get("text", "")
-            print("✅ Script executed successfully")
-            print(f"   Output preview: {output[:150]}...")
+            preview = content[0].get("text", "")[:150]
+            lines.append("✅ Script executed successfully")
+            lines.append(f"   Output preview: {preview}...")
             tests_passed += 1
         else:
-            print("❌ No script output returned")
+            lines.append("❌ No script output returned")
     else:
-        print(f"❌ Script execution failed: {response.error}")
+        lines.append(f"❌ Script execution failed: {response.error}")
 
     # Results
     success_rate = (tests_passed / tests_total * 100) if tests_total > 0 else 0
 
-    print("\n" + "=" * 30)
-    print("📊 Test Results")
-    print(f"Passed: {tests_passed}/{tests_total}")
-    print(f"Success Rate: {success_rate:.1f}%")
+    lines.append("\n" + "=" * 30)
+    lines.append("📊 Test Results")
+    lines.append(f"Passed: {tests_passed}/{tests_total}")
+    lines.append(f"Success Rate: {success_rate:.1f}%")
 
     if tests_passed == tests_total:
-        print("🎉 All tests passed!")
+        lines.append("🎉 All tests passed!")
     else:
-        print(f"⚠️ {tests_total - tests_passed} test(s) failed")
+        lines.append(f"⚠️ {tests_total - tests_passed} test(s) failed")
 
+    sys.stdout.write("\n".join(lines) + "\n")
     return tests_passed == tests_total
 
 
+_INTERACTIVE_INTRO = """
+🎮 Interactive Mode
+Commands:
+  list - List available tools
+  call <tool_name> [json_args] - Call a tool
+  help - Show this help
+  quit - Exit
+
+"""
+
+_INTERACTIVE_HELP = """Available commands:
+  list - List available tools
+  call run_script {"script_name": "hello"}
+  call list_scripts
+  call get_working_directory
+  quit - Exit
+"""
+
+
 async def interactive_mode(client: MCPClient):
     """Interactive mode for manual testing."""
-    print("\n🎮 Interactive Mode")
-    print("Commands:")
-    print("  list - List available tools")
-    print("  call <tool_name> [json_args] - Call a tool")
-    print("  help - Show this help")
-    print("  quit - Exit")
-    print()
+    sys.stdout.write(_INTERACTIVE_INTRO)
 
     while True:
         try:
@@ -272,21 +521,15 @@ async def interactive_mode(client: MCPClient):
             elif command == "quit":
                 break
             elif command == "help":
-                print("Available commands:")
-                print("  list - List available tools")
-                print("  call run_script {\"script_name\": \"hello\"}")
-                print("  call list_scripts")
-                print("  call get_working_directory")
-                print("  quit - Exit")
+                sys.stdout.write(_INTERACTIVE_HELP)
             elif command == "list":
                 response = await client.list_tools()
                 if response.success:
                     tools = response.data.get("tools", [])
-                    print(f"Available tools ({len(tools)}):")
+                    lines = [f"Available tools ({len(tools)}):"]
                     for tool in tools:
-                        print(f"  📋 {tool['name']}")
-                        print(f"     {tool['description']}")
-                        print()
+                        lines.append(f"  📋 {tool['name']}\n     {tool['description']}\n")
+                    sys.stdout.write("\n".join(lines) + "\n")
                 else:
                     print(f"❌ Error: {response.error}")
             elif command.startswith("call "):
@@ -323,51 +566,51 @@ async def interactive_mode(client: MCPClient):
             print(f"❌ Error: {e}")
 
 
-async def main():
-    """Main entry point."""
-    import argparse
+_USAGE = """usage: client.py [-h] [--interactive | -i] [--test | -t]
 
-    parser = argparse.ArgumentParser(description="MCP Client")
-    parser.add_argument("--interactive", "-i", action="store_true", help="Interactive mode")
-    parser.add_argument("--test", "-t", action="store_true", help="Run tests")
+MCP Client
 
-    args = parser.parse_args()
+options:
+  -h, --help         show this help message and exit
+  --interactive, -i  Interactive mode
+  --test, -t         Run tests (default)"""
+
+
+async def main():
+    """Main entry point."""
+    # Two flags do not warrant importing argparse on every start
+    args = parse_args(_USAGE, ("--interactive", "-i", "--test", "-t"))
+    interactive = "-i" in args or "--interactive" in args
 
     # Check server readiness first
     print("🔍 Checking server readiness...")
-    import subprocess
-    result = subprocess.run([sys.executable, "server_manager.py", "status"],
-                          capture_output=True, text=True)
+    from server_manager import ServerManager
 
-    if "Server environment ready" not in result.stdout:
+    if not ServerManager().is_server_ready():
         print("❌ Server environment not ready")
         print("💡 Run: python3 server_manager.py status")
         sys.exit(1)
 
-    client = MCPClient()
-
     try:
         # Connect to server
-        if not await client.connect():
+        client = await get_client()
+        if client is None:
             sys.exit(1)
 
-        if args.interactive:
+        if interactive:
             await interactive_mode(client)
-        elif args.test:
-            success = await run_tests(client)
-            sys.exit(0 if success else 1)
         else:
-            # Default: run tests
+            # Default (and --test/-t): run tests
             success = await run_tests(client)
             sys.exit(0 if success else 1)
 
     finally:
-        await client.disconnect()
+        await close_shared_client()
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         print("\n🛑 Client interrupted")
         sys.exit(1)
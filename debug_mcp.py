@@ -4,13 +4,19 @@
 import asyncio
 import json
 import sys
-import os
-from pathlib import Path
+
+from _paths import SERVER_ENV, dumps, dumps_pretty, loads, run
+
+
+def _print_response(response):
+    """Pretty-print a response straight to stdout as bytes."""
+    # Flush pending print() output so the two streams stay in order
+    sys.stdout.flush()
+    sys.stdout.buffer.write("📥 Response: ".encode() + dumps_pretty(response) + b"\n")
+    sys.stdout.buffer.flush()
+
 
 async def debug_mcp():
-    env = os.environ.copy()
-    env["PYTHONPATH"] = f"{Path.cwd() / 'src'}:{env.get('PYTHONPATH', '')}"
-    
     print("🔍 Starting MCP debug session...")
     
     process = await asyncio.create_subprocess_exec(
@@ -18,16 +24,9 @@ async def debug_mcp():
         stdin=asyncio.subprocess.PIPE,
         stdout=asyncio.subprocess.PIPE,
         stderr=asyncio.subprocess.PIPE,
-        env=env
+        env=SERVER_ENV
     )
     
-    await asyncio.sleep(1)
-    
-    if process.returncode is not None:
-        stderr = await process.stderr.read()
-        print(f"❌ Server failed: {stderr.decode()}")
-        return
-    
     print("✅ Server started")
     
     # Initialize
@@ -43,12 +42,17 @@ async def debug_mcp():
     }
     
     print(f"📤 Sending: {json.dumps(init_request)}")
-    process.stdin.write((json.dumps(init_request) + "\n").encode())
+    process.stdin.write(dumps(init_request) + b"\n")
     await process.stdin.drain()
     
+    # The initialize response doubles as the readiness signal
     response_line = await process.stdout.readline()
-    response = json.loads(response_line.decode().strip())
-    print(f"📥 Response: {json.dumps(response, indent=2)}")
+    if not response_line:
+        stderr = await process.stderr.read()
+        print(f"❌ Server failed: {stderr.decode()}")
+        return
+    response = loads(response_line)
+    _print_response(response)
     
     # Send initialized notification
     notification = {
@@ -58,7 +62,7 @@ async def debug_mcp():
     }
     
     print(f"📤 Sending notification: {json.dumps(notification)}")
-    process.stdin.write((json.dumps(notification) + "\n").encode())
+    process.stdin.write(dumps(notification) + b"\n")
     await process.stdin.drain()
     
     # List tools
@@ -70,12 +74,12 @@ async def debug_mcp():
     }
     
     print(f"📤 Sending: {json.dumps(tools_request)}")
-    process.stdin.write((json.dumps(tools_request) + "\n").encode())
+    process.stdin.write(dumps(tools_request) + b"\n")
     await process.stdin.drain()
     
     response_line = await process.stdout.readline()
-    response = json.loads(response_line.decode().strip())
-    print(f"📥 Response: {json.dumps(response, indent=2)}")
+    response = loads(response_line)
+    _print_response(response)
     
     # Call a tool
     tool_request = {
@@ -89,16 +93,16 @@ async def debug_mcp():
     }
     
     print(f"📤 Sending: {json.dumps(tool_request)}")
-    process.stdin.write((json.dumps(tool_request) + "\n").encode())
+    process.stdin.write(dumps(tool_request) + b"\n")
     await process.stdin.drain()
     
     response_line = await process.stdout.readline()
-    response = json.loads(response_line.decode().strip())
-    print(f"📥 Response: {json.dumps(response, indent=2)}")
+    response = loads(response_line)
+    _print_response(response)
     
     # Cleanup
     process.terminate()
     await process.wait()
     print("🛑 Server stopped")
 
-asyncio.run(debug_mcp())
+run(debug_mcp())
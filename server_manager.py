@@ -5,15 +5,10 @@ Simple MCP Server Manager
 Manages server lifecycle but allows individual test clients to connect independently.
 """
 
-import asyncio
-import json
-import os
-import signal
-import subprocess
 import sys
-import time
 from pathlib import Path
-from typing import Optional
+
+from _paths import SERVER_ENV, dumps, loads, parse_args, usage_error
 
 
 class ServerManager:
@@ -46,12 +41,9 @@ class ServerManager:
     
     def get_server_command(self) -> list:
         """Get the command to start the MCP server."""
-        env = os.environ.copy()
-        env["PYTHONPATH"] = f"{Path.cwd() / 'src'}:{env.get('PYTHONPATH', '')}"
-        
         return {
             "cmd": [sys.executable, "-m", "mcp_script_runner.server"],
-            "env": env
+            "env": SERVER_ENV
         }
     
     def test_server_startup(self) -> bool:
@@ -61,21 +53,39 @@ class ServerManager:
         
         print("🧪 Testing server startup...")
         
+        # Only the startup probe spawns processes, so keep asyncio off the
+        # import path of status checks
+        import asyncio
+        
+        try:
+            success = asyncio.run(self._test_server_startup_async())
+        except Exception as e:
+            print(f"❌ Server startup test failed: {e}")
+            return False
+        
+        if success:
+            print("✅ Server startup test successful")
+            return True
+        
+        print("❌ Server startup test failed")
+        return False
+    
+    async def _test_server_startup_async(self) -> bool:
+        """Spawn the server and wait up to 3s for its initialize response."""
+        import asyncio
+        
+        server_info = self.get_server_command()
+        
+        # Start server process
+        process = await asyncio.create_subprocess_exec(
+            *server_info["cmd"],
+            env=server_info["env"],
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        
         try:
-            server_info = self.get_server_command()
-            
-            # Start server process
-            process = subprocess.Popen(
-                server_info["cmd"],
-                env=server_info["env"],
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
-            
-            # Give it a moment to start
-            time.sleep(1)
-            
             # Send a simple initialize request
             init_request = {
                 "jsonrpc": "2.0",
@@ -88,38 +98,30 @@ class ServerManager:
                 }
             }
             
-            request_json = json.dumps(init_request) + "\n"
-            process.stdin.write(request_json.encode())
-            process.stdin.flush()
+            process.stdin.write(dumps(init_request) + b"\n")
+            await process.stdin.drain()
             
-            # Try to read response with timeout
+            # The initialize response doubles as the readiness signal
             try:
-                # Use select or timeout mechanism
-                import select
-                ready, _, _ = select.select([process.stdout], [], [], 3)
-                
-                if ready:
-                    response_line = process.stdout.readline()
-                    if response_line:
-                        response = json.loads(response_line.decode().strip())
-                        if "result" in response:
-                            print("✅ Server startup test successful")
-                            process.terminate()
-                            process.wait()
-                            return True
-                
-            except Exception as e:
-                print(f"⚠️ Response parsing error: {e}")
+                response_line = await asyncio.wait_for(process.stdout.readline(), timeout=3)
+            except asyncio.TimeoutError:
+                return False
             
-            # Cleanup
-            process.terminate()
-            process.wait()
-            print("❌ Server startup test failed")
-            return False
+            if not response_line:
+                return False
             
-        except Exception as e:
-            print(f"❌ Server startup test failed: {e}")
-            return False
+            try:
+                response = loads(response_line)
+            except ValueError as e:
+                print(f"⚠️ Response parsing error: {e}")
+                return False
+            
+            return "result" in response
+        
+        finally:
+            if process.returncode is None:
+                process.terminate()
+            await process.wait()
     
     def status(self):
         """Show server status and configuration."""
@@ -133,12 +135,11 @@ class ServerManager:
             # Show configuration details
             config_file = Path.cwd() / ".mcp-config.json"
             try:
-                with open(config_file, "r") as f:
-                    config = json.load(f)
-                    scripts = config.get("scripts", {})
-                    print(f"   📜 Scripts configured: {len(scripts)}")
-                    for name in scripts.keys():
-                        print(f"      - {name}")
+                config = loads(config_file.read_bytes())
+                scripts = config.get("scripts", {})
+                print(f"   📜 Scripts configured: {len(scripts)}")
+                for name in scripts.keys():
+                    print(f"      - {name}")
             except Exception as e:
                 print(f"   ⚠️ Configuration error: {e}")
             
@@ -152,21 +153,32 @@ class ServerManager:
             print("❌ Server environment not ready")
 
 
+_USAGE = """usage: server_manager.py [-h] {status,test}
+
+MCP Server Manager
+
+positional arguments:
+  {status,test}  Action to perform
+
+options:
+  -h, --help     show this help message and exit"""
+
+
 def main():
     """Main entry point."""
-    import argparse
-    
-    parser = argparse.ArgumentParser(description="MCP Server Manager")
-    parser.add_argument("action", choices=["status", "test"], 
-                       help="Action to perform")
-    
-    args = parser.parse_args()
+    # A single positional argument does not warrant importing argparse
+    args = parse_args(_USAGE, ("status", "test"))
+    if not args:
+        usage_error(_USAGE, "the following arguments are required: action")
+    if len(args) > 1:
+        usage_error(_USAGE, f"unrecognized arguments: {' '.join(args[1:])}")
+    action = args[0]
     
     manager = ServerManager()
     
-    if args.action == "status":
+    if action == "status":
         manager.status()
-    elif args.action == "test":
+    elif action == "test":
         success = manager.test_server_startup()
         sys.exit(0 if success else 1)
 
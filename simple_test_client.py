@@ -6,10 +6,12 @@ A streamlined test client for the MCP Script Runner server.
 """
 
 import asyncio
+import collections
 import json
 import sys
 import os
-from pathlib import Path
+
+from _paths import SERVER_ENV, dumps, loads, parse_args, run
 
 
 class SimpleMCPClient:
@@ -18,28 +20,25 @@ class SimpleMCPClient:
     def __init__(self):
         self.process = None
         self.request_id = 0
+        self.debug = os.environ.get("MCP_CLIENT_DEBUG") == "1"
+        self._stderr_task = None
+        # Last lines of server stderr, reported if the server dies early
+        self._stderr_tail = collections.deque(maxlen=20)
     
     async def start_server(self):
         """Start the MCP server."""
-        env = os.environ.copy()
-        env["PYTHONPATH"] = f"{Path.cwd() / 'src'}:{env.get('PYTHONPATH', '')}"
-        
         print("🚀 Starting MCP server...")
         
         self.process = await asyncio.create_subprocess_exec(
             sys.executable, "-m", "mcp_script_runner.server",
             stdin=asyncio.subprocess.PIPE,
             stdout=asyncio.subprocess.PIPE,
+            # Server stderr is always drained, so the pipe never fills up;
+            # it is only echoed in debug mode
             stderr=asyncio.subprocess.PIPE,
-            env=env
+            env=SERVER_ENV
         )
-        
-        await asyncio.sleep(1)
-        
-        if self.process.returncode is not None:
-            stderr = await self.process.stderr.read()
-            print(f"❌ Server failed: {stderr.decode()}")
-            return False
+        self._stderr_task = asyncio.create_task(self._drain_stderr())
         
         print("✅ Server started")
         return True
@@ -51,6 +50,14 @@ class SimpleMCPClient:
             await self.process.wait()
             print("🛑 Server stopped")
     
+    async def _drain_stderr(self):
+        """Drain server stderr, keeping its tail and echoing it in debug mode."""
+        while line := await self.process.stderr.readline():
+            text = line.decode(errors='replace')
+            self._stderr_tail.append(text)
+            if self.debug:
+                sys.stderr.write(f"[server] {text}")
+    
     async def send_request(self, method, params=None):
         """Send an MCP request."""
         self.request_id += 1
@@ -61,14 +68,17 @@ class SimpleMCPClient:
             "params": params or {}
         }
         
-        request_json = json.dumps(request) + "\n"
-        self.process.stdin.write(request_json.encode())
-        await self.process.stdin.drain()
+        try:
+            self.process.stdin.write(dumps(request) + b"\n")
+            await self.process.stdin.drain()
+        except ConnectionError:
+            # The server already exited; the caller reports why
+            return None
         
         try:
             response_line = await asyncio.wait_for(self.process.stdout.readline(), timeout=5.0)
             if response_line:
-                return json.loads(response_line.decode().strip())
+                return loads(response_line)
             return None
         except asyncio.TimeoutError:
             print(f"❌ Timeout waiting for {method} response")
@@ -82,8 +92,7 @@ class SimpleMCPClient:
             "params": params or {}
         }
         
-        request_json = json.dumps(notification) + "\n"
-        self.process.stdin.write(request_json.encode())
+        self.process.stdin.write(dumps(notification) + b"\n")
         await self.process.stdin.drain()
     
     async def initialize(self):
@@ -101,6 +110,12 @@ class SimpleMCPClient:
             return True
         else:
             print("❌ Initialization failed")
+            if self.process.returncode is not None or self.process.stdout.at_eof():
+                returncode = await self.process.wait()
+                await self._stderr_task
+                print(f"❌ Server exited with code {returncode}: {''.join(self._stderr_tail)}")
+            elif not self.debug:
+                print("💡 Set MCP_CLIENT_DEBUG=1 to see server errors")
             return False
     
     async def list_tools(self):
@@ -242,14 +257,13 @@ async def interactive_mode():
 
 async def main():
     """Main entry point."""
-    import argparse
-    
-    parser = argparse.ArgumentParser(description="Simple MCP Test Client")
-    parser.add_argument("--interactive", "-i", action="store_true", help="Interactive mode")
-    
-    args = parser.parse_args()
+    # A single flag does not warrant importing argparse on every start
+    args = parse_args(
+        "usage: simple_test_client.py [-h] [--interactive | -i]",
+        ("--interactive", "-i"),
+    )
     
-    if args.interactive:
+    if "-i" in args or "--interactive" in args:
         await interactive_mode()
     else:
         success = await run_tests()
@@ -258,7 +272,7 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         print("\nTest interrupted")
         sys.exit(1)
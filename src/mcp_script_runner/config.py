@@ -1,34 +1,197 @@
 """Configuration management for MCP Script Runner."""
 
+import functools
+import hashlib
 import json
 import os
+import pickle
+import re
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple, Union
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, validator
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps_pretty(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:  # orjson is an optional speedup
+    _loads = json.loads
+
+    def _dumps_pretty(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+try:
+    import msgspec
+except ImportError:  # msgspec is an optional speedup
+    msgspec = None
+
+# Docker image reference: optional registry host (with port), slash
+# separated lowercase name components, then an optional tag and digest
+_DOCKER_IMAGE_RE = re.compile(
+    r"(?:[a-zA-Z0-9](?:[a-zA-Z0-9.-]*[a-zA-Z0-9])?(?::[0-9]+)?/)?"
+    r"[a-z0-9]+(?:(?:[._]|__|-+)[a-z0-9]+)*"
+    r"(?:/[a-z0-9]+(?:(?:[._]|__|-+)[a-z0-9]+)*)*"
+    r"(?::[a-zA-Z0-9_][a-zA-Z0-9._-]{0,127})?"
+    r"(?:@[a-zA-Z][a-zA-Z0-9]*(?:[-_+.][a-zA-Z][a-zA-Z0-9]*)*:[0-9a-fA-F]{32,})?"
+)
+# Absolute container path without NUL bytes
+_MOUNT_PATH_RE = re.compile(r"/[^\0]*")
+
+# Bumped whenever a changed config file is loaded, so existence checks
+# cached before the change are not reused after it
+_path_epoch = 0
+
+
+def _stat_exists(path: str) -> bool:
+    """Check whether a path exists, without caching."""
+    try:
+        os.stat(path)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=256)
+def _path_exists(path: str, _bust: int = 0) -> bool:
+    """Check whether a path exists, caching the answer per _bust value.
+
+    Only for ConfigManager's load and lookup paths, which bump the epoch;
+    the public models check the file system directly.
+    """
+    return _stat_exists(path)
+
+
+@functools.lru_cache(maxsize=64)
+def _list_directory(directory: str, _bust: int = 0) -> Optional[FrozenSet[str]]:
+    """List a directory once per _bust value.
+
+    Returns the names of the entries that are not symlinks, or None if the
+    directory cannot be listed.
+    """
+    try:
+        with os.scandir(directory) as it:
+            return frozenset(entry.name for entry in it if not entry.is_symlink())
+    except (OSError, ValueError):
+        return None
+
+
+def _script_exists(path: str, _bust: int = 0) -> bool:
+    """Check whether a script path exists.
+
+    Scripts usually share a few directories, so each directory is read
+    once per _bust value instead of stat-ing every script in it. Only hits
+    are trusted: a name missing from the listing may still exist on a
+    case-insensitive or normalizing file system, and symlinks need a stat
+    to tell whether their target exists.
+    """
+    directory, name = os.path.split(path)
+    if name not in ("", ".", ".."):
+        plain = _list_directory(directory or ".", _bust)
+        if plain is not None and name in plain:
+            return True
+    return _path_exists(path, _bust)
+
+
+def _check_script_path(path: str) -> None:
+    """Raise if a script path does not exist in the current epoch."""
+    if not _script_exists(path, _path_epoch):
+        raise ValueError(f"Script path does not exist: {path}")
+
+
+def _read_file(path: Path) -> Tuple[bytes, os.stat_result]:
+    """Read a whole file unbuffered, with the stat of what was read."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        stat = os.fstat(fd)
+        chunks = [os.read(fd, stat.st_size or 1 << 16)]
+        # Keep going in case the file grew since the fstat
+        while chunks[-1]:
+            chunks.append(os.read(fd, 1 << 16))
+    finally:
+        os.close(fd)
+    return b"".join(chunks), stat
+
+
+def _invalidate_path_checks() -> None:
+    """Start a new epoch of cached existence checks."""
+    global _path_epoch
+    _path_epoch += 1
 
 
 class ScriptConfig(BaseModel):
     """Configuration for a single script."""
 
+    # Frozen so validated instances can be cached and shared between loads
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     name: str = Field(..., description="Name of the script")
     path: str = Field(..., description="Path to the script file")
     description: str = Field("", description="Description of what the script does")
     arguments: List[str] = Field(default_factory=list, description="List of argument names")
     working_directory: Optional[str] = Field(None, description="Working directory for script execution")
     timeout: int = Field(300, description="Script execution timeout in seconds")
+    # Best effort and racy: both are applied to the script's process after
+    # it has started, so commands it forks straight away may run before
+    # them, with the server's affinity and niceness
+    cpu_set: Optional[List[int]] = Field(None, description="CPUs to pin the script to, best effort (Linux only)")
+    nice: Optional[int] = Field(None, description="Niceness increment for the script process, best effort")
+
+    def validate_path(self) -> None:
+        """Validate that the script path exists.
+
+        Deferred until the script is actually used, so loading a config
+        does not stat every script it lists.
+        """
+        _check_script_path(self.path)
 
-    @validator('path')
-    def validate_path(cls, v: str) -> str:
+
+@dataclass(frozen=True, slots=True)
+class ScriptConfigFast:
+    """Compact, read-only copy of a validated ScriptConfig.
+
+    Pydantic v2 models cannot use __slots__, so lookups and listings use
+    this mirror, built once per load, where attribute access is a plain
+    slot read.
+    """
+
+    name: str
+    path: str
+    description: str
+    arguments: Tuple[str, ...]
+    working_directory: Optional[str]
+    timeout: int
+    cpu_set: Optional[Tuple[int, ...]]
+    nice: Optional[int]
+
+    @classmethod
+    def from_model(cls, script: ScriptConfig) -> "ScriptConfigFast":
+        """Copy the fields of an already validated ScriptConfig."""
+        return cls(
+            script.name,
+            script.path,
+            script.description,
+            tuple(script.arguments),
+            script.working_directory,
+            script.timeout,
+            tuple(script.cpu_set) if script.cpu_set is not None else None,
+            script.nice,
+        )
+
+    def validate_path(self) -> None:
         """Validate that the script path exists."""
-        if not os.path.exists(v):
-            raise ValueError(f"Script path does not exist: {v}")
-        return v
+        _check_script_path(self.path)
 
 
 class MCPConfig(BaseModel):
     """Main configuration for MCP Script Runner."""
 
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     working_directory: str = Field(default=".", description="Default working directory")
     scripts: Dict[str, ScriptConfig] = Field(default_factory=dict, description="Script configurations")
     docker_image: str = Field("ubuntu:22.04", description="Docker image to use for execution")
@@ -38,28 +201,283 @@ class MCPConfig(BaseModel):
     @validator('working_directory')
     def validate_working_directory(cls, v: str) -> str:
         """Validate that the working directory exists."""
-        if not os.path.exists(v):
+        if not _stat_exists(v):
             raise ValueError(f"Working directory does not exist: {v}")
         return v
 
+    @field_validator('docker_image')
+    @classmethod
+    def validate_docker_image(cls, v: str) -> str:
+        """Validate that the Docker image is a well-formed reference."""
+        if not _DOCKER_IMAGE_RE.fullmatch(v):
+            raise ValueError(f"Invalid Docker image reference: {v}")
+        return v
+
+    @field_validator('mount_path')
+    @classmethod
+    def validate_mount_path(cls, v: str) -> str:
+        """Validate that the mount path is an absolute container path."""
+        if not _MOUNT_PATH_RE.fullmatch(v):
+            raise ValueError(f"Mount path must be an absolute path: {v}")
+        return v
+
+
+if msgspec is not None:
+    # msgspec mirrors of the models above. When available they type-check
+    # raw config data in C, and the pydantic models are then built with
+    # model_construct instead of running pydantic validation a second time.
+    # They are used strictly: data that is not already of the exact field
+    # types goes on to pydantic, whose coercion rules differ from msgspec's.
+    class _ScriptConfigStruct(msgspec.Struct, frozen=True, forbid_unknown_fields=True):
+        name: str
+        path: str
+        description: str = ""
+        arguments: List[str] = []
+        working_directory: Optional[str] = None
+        timeout: int = 300
+        cpu_set: Optional[List[int]] = None
+        nice: Optional[int] = None
+
+    class _SettingsStruct(msgspec.Struct, frozen=True, forbid_unknown_fields=True):
+        working_directory: str = "."
+        docker_image: str = "ubuntu:22.04"
+        container_name: str = "mcp-script-runner"
+        mount_path: str = "/workspace"
+
+
+def _convert(data: Dict[str, Any], struct_type: type) -> Optional[Dict[str, Any]]:
+    """Type-check raw data against a msgspec mirror, filling in defaults.
+
+    Returns None if the data does not match exactly, leaving it to pydantic
+    to coerce it or report the error.
+    """
+    try:
+        return msgspec.structs.asdict(msgspec.convert(data, type=struct_type, strict=True))
+    except msgspec.ValidationError:
+        return None
+
+
+def _validate_config(settings: Dict[str, Any], scripts: Dict[str, Any]) -> MCPConfig:
+    """Validate top-level settings around already built script entries."""
+    fields = None
+    if msgspec is not None and all(isinstance(s, ScriptConfig) for s in scripts.values()):
+        fields = _convert(settings, _SettingsStruct)
+    if fields is None:
+        # ScriptConfig instances are passed through without revalidation
+        return MCPConfig(**settings, scripts=scripts)
+
+    # model_construct skips the field validators, so run them here
+    if not _path_exists(fields["working_directory"], _path_epoch):
+        raise ValueError(f"Working directory does not exist: {fields['working_directory']}")
+    MCPConfig.validate_docker_image(fields["docker_image"])
+    MCPConfig.validate_mount_path(fields["mount_path"])
+    return MCPConfig.model_construct(scripts=scripts, **fields)
+
+
+def _freeze(value: Any) -> Tuple[type, Any]:
+    """Make a raw field value hashable, keeping the type of all it holds.
+
+    True, 1 and 1.0 are equal and hash alike, but pydantic does not treat
+    them alike, so they must never share a cached validation result.
+    """
+    if isinstance(value, list):
+        return list, tuple((type(item), item) for item in value)
+    return type(value), value
+
+
+def _thaw(frozen: Tuple[type, Any]) -> Any:
+    """Get back the raw field value from _freeze's result."""
+    kind, value = frozen
+    if kind is list:
+        return [item for _, item in value]
+    return value
+
+
+@functools.lru_cache(maxsize=512)
+def _build_script_config(fields: Tuple[Tuple[str, Tuple[type, Any]], ...]) -> ScriptConfig:
+    """Validate a script entry.
+
+    Keyed by the entry's fields and their types, so identical entries are
+    only validated once. Validation never touches the file system, so
+    nothing else can make a cached result stale.
+    """
+    data = {key: _thaw(frozen) for key, frozen in fields}
+    if msgspec is not None:
+        converted = _convert(data, _ScriptConfigStruct)
+        if converted is not None:
+            return ScriptConfig.model_construct(**converted)
+    return ScriptConfig.model_validate(data)
+
+
+def _script_config_from_entry(entry: Any) -> Any:
+    """Validate a raw script entry, reusing cached results where possible.
+
+    Entries that cannot be keyed are returned unchanged so MCPConfig
+    validation reports the problem.
+    """
+    if not isinstance(entry, dict):
+        return entry
+
+    fields = tuple(sorted((key, _freeze(value)) for key, value in entry.items()))
+    try:
+        return _build_script_config(fields)
+    except TypeError:  # unhashable field value
+        return entry
+
+
+class _ScriptTrie:
+    """Prefix tree of script names, split into '/'-separated namespaces."""
+
+    __slots__ = ("children", "entry")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_ScriptTrie"] = {}
+        # (position in the config, name, config)
+        self.entry: Optional[Tuple[int, str, ScriptConfigFast]] = None
+
+    def insert(self, path_parts: Sequence[str], index: int, name: str, config: ScriptConfigFast) -> None:
+        """Store a script under the given name parts and config position."""
+        node = self
+        for part in path_parts:
+            node = node.children.setdefault(part, _ScriptTrie())
+        node.entry = (index, name, config)
+
+    def _find(self, path_parts: Sequence[str]) -> Optional["_ScriptTrie"]:
+        node: Optional[_ScriptTrie] = self
+        for part in path_parts:
+            node = node.children.get(part)
+            if node is None:
+                return None
+        return node
+
+    def lookup(self, path_parts: Sequence[str]) -> Optional[ScriptConfigFast]:
+        """Get the script stored under exactly these name parts."""
+        node = self._find(path_parts)
+        if node is None or node.entry is None:
+            return None
+        return node.entry[2]
+
+    def prefix_iter(self, prefix_parts: Sequence[str]) -> Iterator[Tuple[str, ScriptConfigFast]]:
+        """Yield (name, config) for every script at or below a namespace.
+
+        Scripts come out in their configured order, not grouped by namespace.
+        """
+        node = self._find(prefix_parts)
+        stack = [node] if node is not None else []
+        entries = []
+        while stack:
+            node = stack.pop()
+            if node.entry is not None:
+                entries.append(node.entry)
+            stack.extend(node.children.values())
+        entries.sort()
+        for _, name, config in entries:
+            yield name, config
+
+
+# Identifies the layout of pickled sidecars. The model field names are part
+# of it, so a sidecar pickled by a different version of the models is never
+# unpickled into this one; bump the number for other layout changes.
+_SIDECAR_FORMAT = (1, tuple(ScriptConfig.model_fields), tuple(MCPConfig.model_fields))
+
+
+def _sidecar_path(config_path: Path) -> Path:
+    """Get the per-user cache file for a config file's parsed copy.
+
+    Kept out of the project directory, so a checkout can never ship a
+    pickle that the server would load.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    key = hashlib.sha256(os.fsencode(os.path.abspath(config_path))).hexdigest()
+    return Path(cache_home) / "mcp-script-runner" / f"{key}.pkl"
+
 
 class ConfigManager:
     """Manages loading and validation of MCP configuration."""
 
     def __init__(self, config_path: str = ".mcp-config.json"):
         self.config_path = Path(config_path)
+        # Parsed copy of the file, reused by later processes while it is current
+        self._sidecar_path = _sidecar_path(self.config_path)
         self._config: Optional[MCPConfig] = None
+        # Raw bytes, parsed data and mtime of the last file that passed validation
+        self._raw_bytes: Optional[bytes] = None
+        self._raw_data: Optional[Dict[str, Any]] = None
+        # (st_mtime_ns, st_size, config) of the last load from the file
+        self._cache: Optional[Tuple[int, int, MCPConfig]] = None
+        # Whether _cache holds the result of a trusted, unvalidated load
+        self._cache_trusted = False
+        # Bumped on every load so dependents can tell when to rebuild caches
+        self._generation = 0
+        # Working directory as configured -> absolute path, filled per load
+        self._resolved_dirs: Dict[str, str] = {}
+        self._trie = _ScriptTrie()
+        # Script name -> (model, compact copy), rebuilt per load but reusing
+        # copies whose model instance survived the reload
+        self._fast_scripts: Dict[str, Tuple[ScriptConfig, ScriptConfigFast]] = {}
+        self._scripts_list_cache: Optional[Tuple[str, ...]] = None
+        self._script_configs_cache: Optional[Tuple[ScriptConfigFast, ...]] = None
 
-    def load_config(self) -> MCPConfig:
-        """Load configuration from file or create default."""
-        if self.config_path.exists():
-            try:
-                with open(self.config_path, 'r') as f:
-                    config_data = json.load(f)
-                self._config = MCPConfig(**config_data)
-            except Exception as e:
-                raise ValueError(f"Failed to load configuration: {e}")
+    def load_config(self, trusted: bool = False) -> MCPConfig:
+        """Load configuration from file or create default.
+
+        Args:
+            trusted: Skip validation entirely and build the models with
+                model_construct. Only for files known to be valid, such as
+                ones this process wrote itself. A trusted load is never
+                used as the baseline for untrusted loads: those validate
+                the file in full.
+        """
+        try:
+            stat = self.config_path.stat()
+        except FileNotFoundError:
+            stat = None
+
+        if stat is not None:
+            # An untouched file costs just the stat above. The cached config
+            # is frozen, so it can be handed out again as is, and anything
+            # derived from it is still current.
+            if (
+                self._cache is not None
+                and self._cache[:2] == (stat.st_mtime_ns, stat.st_size)
+                and (trusted or not self._cache_trusted)
+            ):
+                self._config = self._cache[2]
+                return self._config
+
+            _invalidate_path_checks()
+            sidecar = self._read_sidecar(stat)
+            if sidecar is not None:
+                config_data, self._config = sidecar
+                self._raw_bytes = None
+                self._raw_data = config_data
+                self._cache = (stat.st_mtime_ns, stat.st_size, self._config)
+                self._cache_trusted = False
+            else:
+                try:
+                    # Keyed by the fstat of the bytes actually read, in case
+                    # the file changed since the stat above
+                    raw_bytes, stat = _read_file(self.config_path)
+                    if raw_bytes == self._raw_bytes:
+                        config_data = self._raw_data
+                    else:
+                        config_data = _loads(raw_bytes)
+                    if trusted:
+                        self._config = self._construct_config(config_data)
+                    else:
+                        self._config = self._build_config(config_data)
+                    # Unvalidated data must not let later loads skip validation
+                    self._raw_bytes = None if trusted else raw_bytes
+                    self._raw_data = None if trusted else config_data
+                    self._cache = (stat.st_mtime_ns, stat.st_size, self._config)
+                    self._cache_trusted = trusted
+                except Exception as e:
+                    raise ValueError(f"Failed to load configuration: {e}")
+                # Only validated results may be reused without validation
+                if not trusted:
+                    self._write_sidecar(stat, config_data, self._config)
         else:
+            self._cache = None
             # Create default configuration
             self._config = MCPConfig(
                 working_directory=".",
@@ -69,8 +487,133 @@ class ConfigManager:
             )
             self._save_default_config()
 
+        self._resolved_dirs = self._resolve_working_directories(self._config)
+        previous_fast = self._fast_scripts
+        self._fast_scripts = {}
+        self._trie = _ScriptTrie()
+        for index, (name, script) in enumerate(self._config.scripts.items()):
+            previous = previous_fast.get(name)
+            if previous is not None and previous[0] is script:
+                fast = previous[1]
+            else:
+                fast = ScriptConfigFast.from_model(script)
+            self._fast_scripts[name] = (script, fast)
+            self._trie.insert(name.split("/"), index, name, fast)
+        self._scripts_list_cache = None
+        self._script_configs_cache = None
+        self._generation += 1
         return self._config
 
+    def _read_sidecar(self, stat: os.stat_result) -> Optional[Tuple[Dict[str, Any], MCPConfig]]:
+        """Get the parsed data and config pickled for this exact file, if any.
+
+        The sidecar records its format and the (st_mtime_ns, st_size) of
+        the file it was built from, so neither an edited file nor a change
+        to the models ever matches a stale sidecar. Only sidecars this user
+        wrote are unpickled at all. The working directory is checked again
+        since it may have gone away.
+        """
+        try:
+            raw_bytes, sidecar_stat = _read_file(self._sidecar_path)
+        except OSError:
+            return None
+        if sidecar_stat.st_mtime_ns < stat.st_mtime_ns or sidecar_stat.st_mode & 0o022:
+            return None
+        if hasattr(os, "getuid") and sidecar_stat.st_uid != os.getuid():
+            return None
+
+        try:
+            entry = pickle.loads(raw_bytes)
+        except Exception:
+            # Truncated, or referring to classes that no longer exist
+            return None
+        if (
+            not isinstance(entry, tuple)
+            or len(entry) != 5
+            or entry[0] != _SIDECAR_FORMAT
+            or entry[1:3] != (stat.st_mtime_ns, stat.st_size)
+            or not isinstance(entry[4], MCPConfig)
+        ):
+            return None
+        if not _path_exists(entry[4].working_directory, _path_epoch):
+            return None
+        return entry[3], entry[4]
+
+    def _write_sidecar(self, stat: os.stat_result, config_data: Dict[str, Any], config: MCPConfig) -> None:
+        """Pickle a freshly validated config to the user's cache, best effort."""
+        entry = (_SIDECAR_FORMAT, stat.st_mtime_ns, stat.st_size, config_data, config)
+        tmp_path = self._sidecar_path.with_name(f"{self._sidecar_path.name}.{os.getpid()}.tmp")
+        try:
+            self._sidecar_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            data = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+            # Private to this user whatever the umask, or it would be ignored
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+            # Atomic, so a concurrent reader never sees a partial pickle
+            os.replace(tmp_path, self._sidecar_path)
+        except (OSError, pickle.PicklingError, TypeError):
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+    @staticmethod
+    def _resolve_working_directories(config: MCPConfig) -> Dict[str, str]:
+        """Resolve every distinct working directory in a config once."""
+        directories = {config.working_directory}
+        directories.update(
+            script.working_directory
+            for script in config.scripts.values()
+            if script.working_directory
+        )
+        return {directory: str(Path(directory).resolve()) for directory in directories}
+
+    @staticmethod
+    def _construct_config(config_data: Dict[str, Any]) -> MCPConfig:
+        """Build an MCPConfig from trusted data without any validation."""
+        scripts = {
+            name: ScriptConfig.model_construct(**entry)
+            for name, entry in config_data.get("scripts", {}).items()
+        }
+        top_level = {k: v for k, v in config_data.items() if k != "scripts"}
+        return MCPConfig.model_construct(scripts=scripts, **top_level)
+
+    def _build_config(self, config_data: Dict[str, Any]) -> MCPConfig:
+        """Build an MCPConfig, validating only what changed since the last load.
+
+        Script entries identical to the previously validated file reuse
+        its ScriptConfig instances (or are rebuilt with model_construct);
+        new or changed entries go through the shared validation cache. A
+        file whose layout no longer matches is validated in full.
+        """
+        previous = self._raw_data
+        scripts = config_data.get("scripts", {})
+        if not isinstance(scripts, dict):
+            return MCPConfig(**config_data)
+
+        previous_scripts = previous.get("scripts", {}) if previous else {}
+        previous_instances = self._cache[2].scripts if self._cache is not None else {}
+        entries: Dict[str, Any] = {}
+        all_trusted = previous is not None
+        for name, entry in scripts.items():
+            if isinstance(entry, dict) and entry == previous_scripts.get(name):
+                instance = previous_instances.get(name)
+                entries[name] = instance or ScriptConfig.model_construct(**entry)
+            else:
+                entries[name] = _script_config_from_entry(entry)
+                all_trusted = False
+
+        top_level = {k: v for k, v in config_data.items() if k != "scripts"}
+        if all_trusted and top_level == {k: v for k, v in previous.items() if k != "scripts"}:
+            return MCPConfig.model_construct(scripts=entries, **top_level)
+
+        return _validate_config(top_level, entries)
+
     def _save_default_config(self) -> None:
         """Save default configuration to file."""
         default_config = {
@@ -89,11 +632,13 @@ class ConfigManager:
             "mount_path": "/workspace"
         }
 
-        with open(self.config_path, 'w') as f:
-            json.dump(default_config, f, indent=2)
+        self.config_path.write_bytes(_dumps_pretty(default_config))
 
     def reload_config(self) -> MCPConfig:
         """Reload configuration from file."""
+        # An explicit reload also rechecks script files, even if the config
+        # file itself is unchanged
+        _invalidate_path_checks()
         self._config = None
         return self.load_config()
 
@@ -104,10 +649,66 @@ class ConfigManager:
             return self.load_config()
         return self._config
 
-    def get_script_config(self, script_name: str) -> Optional[ScriptConfig]:
-        """Get configuration for a specific script."""
-        return self.config.scripts.get(script_name)
+    def get_script_config(self, script_name: str) -> Optional[ScriptConfigFast]:
+        """Get configuration for a specific script.
+
+        Returns the compact copy built when the config was loaded, or None
+        if no script has that name.
+
+        Raises:
+            ValueError: If the script is configured but its file is missing
+        """
+        if self._config is None:
+            self.load_config()
+        script_config = self._trie.lookup(script_name.split("/"))
+        if script_config is not None:
+            script_config.validate_path()
+        return script_config
+
+    def resolve_working_directory(self, script_config: Union[ScriptConfig, ScriptConfigFast]) -> str:
+        """Get the absolute directory a script should run in."""
+        directory = script_config.working_directory or self.config.working_directory
+        resolved = self._resolved_dirs.get(directory)
+        if resolved is None:
+            resolved = self._resolved_dirs[directory] = str(Path(directory).resolve())
+        return resolved
+
+    def set_working_directory(self, path: str) -> None:
+        """Override the default working directory until the next reload."""
+        self._config = self.config.model_copy(update={"working_directory": path})
+        self._resolved_dirs[path] = str(Path(path).resolve())
+
+    def list_scripts(self, prefix: Optional[str] = None) -> Tuple[str, ...]:
+        """List all available script names.
+
+        Args:
+            prefix: Optional namespace such as "build" or "build/" to only
+                list scripts named after it or nested below it; an empty
+                namespace lists every script
+
+        Names are always returned in their configured order.
+        """
+        if self._config is None:
+            self.load_config()
+
+        namespace = prefix.rstrip("/") if prefix is not None else ""
+        if not namespace:
+            # Built once per load; a tuple so callers cannot change it
+            if self._scripts_list_cache is None:
+                self._scripts_list_cache = tuple(self._config.scripts)
+            return self._scripts_list_cache
+
+        return tuple(name for name, _ in self._trie.prefix_iter(namespace.split("/")))
+
+    def list_script_configs(self) -> Tuple[ScriptConfigFast, ...]:
+        """List the configuration of every script, in config order.
+
+        The compact copies are built once per load and shared between
+        callers until the next one.
+        """
+        if self._config is None:
+            self.load_config()
 
-    def list_scripts(self) -> List[str]:
-        """List all available script names."""
-        return list(self.config.scripts.keys())
\ No newline at end of file
+        if self._script_configs_cache is None:
+            self._script_configs_cache = tuple(fast for _, fast in self._fast_scripts.values())
+        return self._script_configs_cache
\ No newline at end of file
@@ -1,11 +1,58 @@
 """Script execution engine for MCP Script Runner."""
 
 import asyncio
+import logging
+import os
 import subprocess
-from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-from .config import ConfigManager, ScriptConfig
+from .config import ConfigManager, ScriptConfigFast
+
+logger = logging.getLogger(__name__)
+
+# Pipe reads are done in fixed-size chunks rather than one unbounded read
+_READ_CHUNK_SIZE = 65536
+
+
+# Caps how many scripts run at once. Shared by every executor so a config
+# reload, which builds a new executor, cannot lift the limit, and created
+# on first use so it belongs to the server's running loop.
+_script_slots: Optional[asyncio.Semaphore] = None
+
+
+def _get_script_slots() -> asyncio.Semaphore:
+    """Get the semaphore bounding concurrent script runs."""
+    global _script_slots
+    if _script_slots is None:
+        _script_slots = asyncio.Semaphore(os.cpu_count() or 4)
+    return _script_slots
+
+
+def _apply_scheduling(pid: int, script_config: ScriptConfigFast) -> None:
+    """Apply a script's CPU affinity and niceness to its process.
+
+    Applied to the running child rather than through preexec_fn, which
+    would force a fork-based spawn and is unsafe in a threaded process.
+    Anything the script starts before this call keeps the server's
+    settings, so scheduling is only a hint: failures are logged instead
+    of failing the run.
+    """
+    try:
+        if script_config.cpu_set and hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(pid, script_config.cpu_set)
+        if script_config.nice:
+            niceness = os.getpriority(os.PRIO_PROCESS, 0) + script_config.nice
+            os.setpriority(os.PRIO_PROCESS, pid, niceness)
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"Could not apply scheduling to script {script_config.name}: {e}")
+
+
+async def _read_stream(stream: asyncio.StreamReader) -> bytearray:
+    """Collect everything written to a pipe until EOF."""
+    data = bytearray()
+    while chunk := await stream.read(_READ_CHUNK_SIZE):
+        data += chunk
+    return data
 
 
 class ScriptExecutionResult:
@@ -47,6 +94,10 @@ class ScriptExecutor:
 
     def __init__(self, config_manager: ConfigManager):
         self.config_manager = config_manager
+        # Script metadata only changes when the config is (re)loaded, so it
+        # is built once per config generation
+        self._list_cache: Optional[Tuple[int, List[Dict]]] = None
+        self._info_cache: Tuple[int, Dict[str, Dict]] = (-1, {})
 
     async def execute_script(
         self,
@@ -69,11 +120,13 @@ class ScriptExecutor:
         if not script_config:
             raise ValueError(f"Script not found: {script_name}")
 
-        return await self._execute_script_config(script_config, arguments or [])
+        # Queueing for a slot does not count towards the execution time
+        async with _get_script_slots():
+            return await self._execute_script_config(script_config, arguments or [])
 
     async def _execute_script_config(
         self,
-        script_config: ScriptConfig,
+        script_config: ScriptConfigFast,
         arguments: List[str]
     ) -> ScriptExecutionResult:
         """Execute a script based on its configuration.
@@ -91,9 +144,8 @@ class ScriptExecutor:
         # Prepare command
         cmd = ["bash", script_config.path] + arguments
 
-        # Determine working directory
-        working_dir = script_config.working_directory or self.config_manager.config.working_directory
-        working_dir_path = Path(working_dir).resolve()
+        # Working directories are resolved once when the config is loaded
+        working_dir = self.config_manager.resolve_working_directory(script_config)
 
         process = None
         try:
@@ -102,12 +154,19 @@ class ScriptExecutor:
                 *cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
-                cwd=str(working_dir_path)
+                cwd=working_dir
             )
-
-            # Wait for completion with timeout
-            stdout_data, stderr_data = await asyncio.wait_for(
-                process.communicate(),
+            if script_config.cpu_set or script_config.nice:
+                _apply_scheduling(process.pid, script_config)
+
+            # Drain both pipes while waiting so neither can fill up and
+            # stall the script; the timeout covers the whole run
+            stdout_data, stderr_data, _ = await asyncio.wait_for(
+                asyncio.gather(
+                    _read_stream(process.stdout),
+                    _read_stream(process.stderr),
+                    process.wait()
+                ),
                 timeout=script_config.timeout
             )
 
@@ -115,8 +174,8 @@ class ScriptExecutor:
 
             return ScriptExecutionResult(
                 exit_code=process.returncode or 0,
-                stdout=stdout_data.decode('utf-8'),
-                stderr=stderr_data.decode('utf-8'),
+                stdout=stdout_data.decode('utf-8', errors='replace'),
+                stderr=stderr_data.decode('utf-8', errors='replace'),
                 execution_time=execution_time,
                 script_name=script_config.name
             )
@@ -138,6 +197,11 @@ class ScriptExecutor:
 
         except Exception as e:
             execution_time = time.time() - start_time
+            # Do not leave a script running behind an error result
+            if process and process.returncode is None:
+                process.kill()
+                await process.wait()
+
             return ScriptExecutionResult(
                 exit_code=1,
                 stdout="",
@@ -152,17 +216,23 @@ class ScriptExecutor:
         Returns:
             List of dictionaries containing script information
         """
-        scripts = []
-        for script_name in self.config_manager.list_scripts():
-            script_config = self.config_manager.get_script_config(script_name)
-            if script_config:
-                scripts.append({
-                    "name": script_config.name,
-                    "description": script_config.description,
-                    "path": script_config.path,
-                    "arguments": script_config.arguments,
-                    "timeout": script_config.timeout
-                })
+        # Listed first so a pending load bumps the generation
+        script_configs = self.config_manager.list_script_configs()
+        generation = self.config_manager._generation
+        if self._list_cache is not None and self._list_cache[0] == generation:
+            return self._list_cache[1]
+
+        scripts = [
+            {
+                "name": script_config.name,
+                "description": script_config.description,
+                "path": script_config.path,
+                "arguments": script_config.arguments,
+                "timeout": script_config.timeout
+            }
+            for script_config in script_configs
+        ]
+        self._list_cache = (generation, scripts)
         return scripts
 
     def get_script_info(self, script_name: str) -> Optional[Dict]:
@@ -178,11 +248,19 @@ class ScriptExecutor:
         if not script_config:
             return None
 
-        return {
-            "name": script_config.name,
-            "description": script_config.description,
-            "path": script_config.path,
-            "arguments": script_config.arguments,
-            "timeout": script_config.timeout,
-            "working_directory": script_config.working_directory
-        }
\ No newline at end of file
+        generation, infos = self._info_cache
+        if generation != self.config_manager._generation:
+            infos = {}
+            self._info_cache = (self.config_manager._generation, infos)
+
+        info = infos.get(script_name)
+        if info is None:
+            info = infos[script_name] = {
+                "name": script_config.name,
+                "description": script_config.description,
+                "path": script_config.path,
+                "arguments": script_config.arguments,
+                "timeout": script_config.timeout,
+                "working_directory": script_config.working_directory
+            }
+        return info
\ No newline at end of file
@@ -1,7 +1,10 @@
 """MCP Script Runner Server."""
 
 import asyncio
+import io
 import logging
+import os
+import sys
 from typing import Any, List, Optional
 
 from mcp.server import Server
@@ -11,6 +14,13 @@ from mcp.types import Tool, TextContent
 from .config import ConfigManager
 from .executor import ScriptExecutor
 
+try:
+    import uvloop
+
+    _run = uvloop.run
+except ImportError:  # uvloop is an optional speedup
+    _run = asyncio.run
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -23,102 +33,105 @@ config_manager = ConfigManager()
 script_executor = ScriptExecutor(config_manager)
 
 
+# Tool definitions never change, so they are built and validated once
+_TOOLS: List[Tool] = [
+    Tool(
+        name="run_script",
+        description="Execute a configured bash script",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "script_name": {
+                    "type": "string",
+                    "description": "Name of the script to execute"
+                },
+                "arguments": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Arguments to pass to the script"
+                }
+            },
+            "required": ["script_name"]
+        }
+    ),
+    Tool(
+        name="list_scripts",
+        description="List all available scripts",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="get_script_info",
+        description="Get detailed information about a specific script",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "script_name": {
+                    "type": "string",
+                    "description": "Name of the script to get info for"
+                }
+            },
+            "required": ["script_name"]
+        }
+    ),
+    Tool(
+        name="get_working_directory",
+        description="Get the current working directory",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="set_working_directory",
+        description="Set the working directory for script execution",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to set as working directory"
+                }
+            },
+            "required": ["path"]
+        }
+    ),
+    Tool(
+        name="reload_config",
+        description="Reload configuration from file",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    )
+]
+
+# Static responses, returned as-is by every call that needs them; the MCP
+# server copies the list into its result, so sharing it is safe
+_RESP_SCRIPT_NAME_REQUIRED = [TextContent(type="text", text="Error: script_name is required")]
+_RESP_PATH_REQUIRED = [TextContent(type="text", text="Error: path is required")]
+_RESP_NO_SCRIPTS = [TextContent(type="text", text="No scripts configured")]
+
+# Last get_working_directory response, as (working directory, response)
+_working_directory_response: tuple = (None, None)
+
+
 @server.list_tools()
 async def list_tools() -> List[Tool]:
     """List available MCP tools."""
-    return [
-        Tool(
-            name="run_script",
-            description="Execute a configured bash script",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "script_name": {
-                        "type": "string",
-                        "description": "Name of the script to execute"
-                    },
-                    "arguments": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Arguments to pass to the script"
-                    }
-                },
-                "required": ["script_name"]
-            }
-        ),
-        Tool(
-            name="list_scripts",
-            description="List all available scripts",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        Tool(
-            name="get_script_info",
-            description="Get detailed information about a specific script",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "script_name": {
-                        "type": "string",
-                        "description": "Name of the script to get info for"
-                    }
-                },
-                "required": ["script_name"]
-            }
-        ),
-        Tool(
-            name="get_working_directory",
-            description="Get the current working directory",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        Tool(
-            name="set_working_directory",
-            description="Set the working directory for script execution",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Path to set as working directory"
-                    }
-                },
-                "required": ["path"]
-            }
-        ),
-        Tool(
-            name="reload_config",
-            description="Reload configuration from file",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        )
-    ]
+    return _TOOLS
 
 
 @server.call_tool()
 async def call_tool(name: str, arguments: dict) -> List[TextContent]:
     """Handle tool calls."""
     try:
-        if name == "run_script":
-            return await handle_run_script(arguments)
-        elif name == "list_scripts":
-            return await handle_list_scripts(arguments)
-        elif name == "get_script_info":
-            return await handle_get_script_info(arguments)
-        elif name == "get_working_directory":
-            return await handle_get_working_directory(arguments)
-        elif name == "set_working_directory":
-            return await handle_set_working_directory(arguments)
-        elif name == "reload_config":
-            return await handle_reload_config(arguments)
-        else:
+        handler = _HANDLERS.get(name)
+        if handler is None:
             return [TextContent(type="text", text=f"Unknown tool: {name}")]
+        return await handler(arguments)
 
     except Exception as e:
         logger.error(f"Error in tool {name}: {e}")
@@ -131,26 +144,26 @@ async def handle_run_script(arguments: dict) -> List[TextContent]:
     script_arguments = arguments.get("arguments", [])
 
     if not script_name:
-        return [TextContent(type="text", text="Error: script_name is required")]
+        return _RESP_SCRIPT_NAME_REQUIRED
 
     try:
         result = await script_executor.execute_script(script_name, script_arguments)
 
-        # Format output
-        output_lines = [
-            f"Script: {result.script_name}",
-            f"Exit Code: {result.exit_code}",
-            f"Execution Time: {result.execution_time:.2f}s",
-            f"Success: {result.success}",
-            "",
-            "STDOUT:",
-            result.stdout,
-            "",
-            "STDERR:",
-            result.stderr
-        ]
-
-        return [TextContent(type="text", text="\n".join(output_lines))]
+        # Format output as a single template rather than joining a list
+        output = (
+            f"Script: {result.script_name}\n"
+            f"Exit Code: {result.exit_code}\n"
+            f"Execution Time: {result.execution_time:.2f}s\n"
+            f"Success: {result.success}\n"
+            f"\n"
+            f"STDOUT:\n"
+            f"{result.stdout}\n"
+            f"\n"
+            f"STDERR:\n"
+            f"{result.stderr}"
+        )
+
+        return [TextContent(type="text", text=output)]
 
     except Exception as e:
         return [TextContent(type="text", text=f"Error executing script: {str(e)}")]
@@ -162,20 +175,20 @@ async def handle_list_scripts(arguments: dict) -> List[TextContent]:
         scripts = script_executor.list_available_scripts()
 
         if not scripts:
-            return [TextContent(type="text", text="No scripts configured")]
+            return _RESP_NO_SCRIPTS
 
-        output_lines = ["Available Scripts:", ""]
+        output = io.StringIO()
+        output.write("Available Scripts:\n")
         for script in scripts:
-            output_lines.extend([
-                f"Name: {script['name']}",
-                f"Description: {script['description']}",
-                f"Path: {script['path']}",
-                f"Arguments: {', '.join(script['arguments']) if script['arguments'] else 'None'}",
-                f"Timeout: {script['timeout']}s",
-                ""
-            ])
+            output.write(
+                f"\nName: {script['name']}\n"
+                f"Description: {script['description']}\n"
+                f"Path: {script['path']}\n"
+                f"Arguments: {', '.join(script['arguments']) if script['arguments'] else 'None'}\n"
+                f"Timeout: {script['timeout']}s\n"
+            )
 
-        return [TextContent(type="text", text="\n".join(output_lines))]
+        return [TextContent(type="text", text=output.getvalue())]
 
     except Exception as e:
         return [TextContent(type="text", text=f"Error listing scripts: {str(e)}")]
@@ -186,7 +199,7 @@ async def handle_get_script_info(arguments: dict) -> List[TextContent]:
     script_name = arguments.get("script_name")
 
     if not script_name:
-        return [TextContent(type="text", text="Error: script_name is required")]
+        return _RESP_SCRIPT_NAME_REQUIRED
 
     try:
         script_info = script_executor.get_script_info(script_name)
@@ -194,18 +207,18 @@ async def handle_get_script_info(arguments: dict) -> List[TextContent]:
         if not script_info:
             return [TextContent(type="text", text=f"Script not found: {script_name}")]
 
-        output_lines = [
-            f"Script Information: {script_name}",
-            "",
-            f"Name: {script_info['name']}",
-            f"Description: {script_info['description']}",
-            f"Path: {script_info['path']}",
-            f"Arguments: {', '.join(script_info['arguments']) if script_info['arguments'] else 'None'}",
-            f"Timeout: {script_info['timeout']}s",
+        output = (
+            f"Script Information: {script_name}\n"
+            f"\n"
+            f"Name: {script_info['name']}\n"
+            f"Description: {script_info['description']}\n"
+            f"Path: {script_info['path']}\n"
+            f"Arguments: {', '.join(script_info['arguments']) if script_info['arguments'] else 'None'}\n"
+            f"Timeout: {script_info['timeout']}s\n"
             f"Working Directory: {script_info['working_directory'] or 'Default'}"
-        ]
+        )
 
-        return [TextContent(type="text", text="\n".join(output_lines))]
+        return [TextContent(type="text", text=output)]
 
     except Exception as e:
         return [TextContent(type="text", text=f"Error getting script info: {str(e)}")]
@@ -213,9 +226,14 @@ async def handle_get_script_info(arguments: dict) -> List[TextContent]:
 
 async def handle_get_working_directory(arguments: dict) -> List[TextContent]:
     """Handle getting current working directory."""
+    global _working_directory_response
     try:
         working_dir = config_manager.config.working_directory
-        return [TextContent(type="text", text=f"Current working directory: {working_dir}")]
+        cached_dir, response = _working_directory_response
+        if cached_dir != working_dir:
+            response = [TextContent(type="text", text=f"Current working directory: {working_dir}")]
+            _working_directory_response = (working_dir, response)
+        return response
 
     except Exception as e:
         return [TextContent(type="text", text=f"Error getting working directory: {str(e)}")]
@@ -226,15 +244,14 @@ async def handle_set_working_directory(arguments: dict) -> List[TextContent]:
     path = arguments.get("path")
 
     if not path:
-        return [TextContent(type="text", text="Error: path is required")]
+        return _RESP_PATH_REQUIRED
 
     try:
-        import os
         if not os.path.exists(path):
             return [TextContent(type="text", text=f"Error: Directory does not exist: {path}")]
 
         # Update the configuration (this is a simple approach, in practice you might want to persist this)
-        config_manager.config.working_directory = path
+        config_manager.set_working_directory(path)
 
         return [TextContent(type="text", text=f"Working directory set to: {path}")]
 
@@ -256,6 +273,34 @@ async def handle_reload_config(arguments: dict) -> List[TextContent]:
         return [TextContent(type="text", text=f"Error reloading configuration: {str(e)}")]
 
 
+# Tool name -> handler, used by call_tool for dispatch
+_HANDLERS = {
+    "run_script": handle_run_script,
+    "list_scripts": handle_list_scripts,
+    "get_script_info": handle_get_script_info,
+    "get_working_directory": handle_get_working_directory,
+    "set_working_directory": handle_set_working_directory,
+    "reload_config": handle_reload_config,
+}
+
+
+def _install_child_watcher() -> None:
+    """Reap script processes through pidfds on the default event loop.
+
+    Before 3.12 asyncio waits on each child from its own thread
+    (ThreadedChildWatcher); a PidfdChildWatcher instead lets the loop
+    poll a process fd. 3.12+ already does this by default.
+    """
+    if sys.version_info >= (3, 12) or not hasattr(os, "pidfd_open"):
+        return
+    try:
+        # pidfd_open needs Linux 5.3+, which the Python build cannot tell us
+        os.close(os.pidfd_open(os.getpid()))
+    except OSError:
+        return
+    asyncio.set_child_watcher(asyncio.PidfdChildWatcher())
+
+
 async def main():
     """Main server entry point."""
     try:
@@ -273,4 +318,8 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # uvloop's libuv-based subprocess handling spawns scripts faster than
+    # the default loop's fork/exec plus child watcher
+    if _run is asyncio.run:
+        _install_child_watcher()
+    _run(main())
\ No newline at end of file
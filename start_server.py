@@ -5,15 +5,27 @@ MCP Script Runner Server Launcher
 Starts the MCP server in the background and provides management commands.
 """
 
-import asyncio
-import json
 import os
-import signal
-import subprocess
 import sys
 import time
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
+
+from _paths import SERVER_ENV
+
+
+def _tail(path: Path, n: int = 20, block_size: int = 8192) -> List[str]:
+    """Read the last n lines of a file without reading all of it."""
+    with open(path, "rb") as f:
+        position = f.seek(0, os.SEEK_END)
+        data = bytearray()
+        # n lines need n + 1 newlines, counting the one before the first
+        while position > 0 and data.count(b"\n") <= n:
+            step = min(block_size, position)
+            position -= step
+            f.seek(position)
+            data[:0] = f.read(step)
+    return data.decode(errors="replace").splitlines()[-n:]
 
 
 class MCPServerManager:
@@ -25,9 +37,7 @@ class MCPServerManager:
         
     def _setup_environment(self) -> dict:
         """Setup environment variables for the server."""
-        env = os.environ.copy()
-        env["PYTHONPATH"] = f"{Path.cwd() / 'src'}:{env.get('PYTHONPATH', '')}"
-        return env
+        return SERVER_ENV
     
     def start_server(self, background: bool = True) -> bool:
         """Start the MCP server."""
@@ -36,6 +46,9 @@ class MCPServerManager:
             print(f"   PID: {self.get_pid()}")
             return True
         
+        # Only needed when actually spawning, not for status/logs
+        import subprocess
+        
         try:
             cmd = [sys.executable, "-m", "mcp_script_runner.server"]
             env = self._setup_environment()
@@ -90,20 +103,16 @@ class MCPServerManager:
             print("⚠️ MCP server is not running")
             return True
         
+        import signal
+        
         try:
             pid = self.get_pid()
             if pid:
                 print(f"🛑 Stopping MCP server (PID: {pid})")
                 os.kill(pid, signal.SIGTERM)
                 
-                # Wait for graceful shutdown
-                for _ in range(10):
-                    if not self.is_running():
-                        break
-                    time.sleep(0.5)
-                
-                # Force kill if still running
-                if self.is_running():
+                # Wait for graceful shutdown, force kill if still running
+                if not self._wait_for_exit(pid, timeout=5.0):
                     print("⚡ Force killing server...")
                     os.kill(pid, signal.SIGKILL)
                 
@@ -119,6 +128,33 @@ class MCPServerManager:
             print(f"❌ Failed to stop server: {e}")
             return False
     
+    def _wait_for_exit(self, pid: int, timeout: float) -> bool:
+        """Wait up to timeout seconds for a process to exit."""
+        # A pidfd becomes readable once the process exits, so one select()
+        # replaces polling; it works for processes we did not spawn too
+        if hasattr(os, "pidfd_open"):
+            try:
+                pidfd = os.pidfd_open(pid)
+            except ProcessLookupError:
+                return True
+            except OSError:
+                pidfd = None  # kernel without pidfd support
+            
+            if pidfd is not None:
+                import select
+                
+                try:
+                    ready, _, _ = select.select([pidfd], [], [], timeout)
+                finally:
+                    os.close(pidfd)
+                return bool(ready)
+        
+        for _ in range(int(timeout / 0.5)):
+            if not self.is_running():
+                return True
+            time.sleep(0.5)
+        return not self.is_running()
+    
     def is_running(self) -> bool:
         """Check if the MCP server is running."""
         pid = self.get_pid()
@@ -165,11 +201,9 @@ class MCPServerManager:
             print(f"\n📋 Server logs ({self.log_file}):")
             print("-" * 50)
             try:
-                with open(self.log_file, "r") as f:
-                    lines = f.readlines()
-                    # Show last 20 lines
-                    for line in lines[-20:]:
-                        print(line.rstrip())
+                # Show last 20 lines
+                for line in _tail(self.log_file, 20):
+                    print(line.rstrip())
             except Exception as e:
                 print(f"❌ Could not read logs: {e}")
             print("-" * 50)
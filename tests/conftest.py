@@ -0,0 +1,11 @@
+"""Shared test setup."""
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_cache_home(tmp_path_factory):
+    """Keep config sidecars written by tests out of the user's cache."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))
+        yield
@@ -2,46 +2,147 @@
 
 import json
 import os
+import pickle
 import tempfile
+from contextlib import nullcontext
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-from mcp_script_runner.config import ConfigManager, MCPConfig, ScriptConfig
+import mcp_script_runner.config as config_module
+from mcp_script_runner.config import ConfigManager, MCPConfig, ScriptConfig, ScriptConfigFast
+
+
+@pytest.fixture(scope="session")
+def dummy_script(tmp_path_factory):
+    """Write the script file the tests point their configs at."""
+    script_path = tmp_path_factory.mktemp("sh") / "test.sh"
+    script_path.write_text("#!/bin/bash\necho 'test'")
+    return script_path
+
+
+def _make_config(tmp_path, scripts):
+    """Build config file contents around the given script entries."""
+    return {
+        "working_directory": str(tmp_path),
+        "scripts": scripts,
+        "docker_image": "ubuntu:22.04",
+        "container_name": "test-container",
+        "mount_path": "/workspace"
+    }
+
+
+@pytest.fixture(scope="module")
+def shared_config_file(tmp_path_factory, dummy_script):
+    """Write one config file shared by the read-only manager tests."""
+    tmp_path = tmp_path_factory.mktemp("cfg")
+    script = str(dummy_script)
+
+    config_data = _make_config(tmp_path, {
+        "test1": {
+            "name": "test1",
+            "path": script,
+            "description": "Test script 1",
+            "arguments": [],
+            "timeout": 30
+        },
+        "test2": {
+            "name": "test2",
+            "path": script,
+            "description": "Test script 2",
+            "arguments": [],
+            "timeout": 30
+        }
+    })
+
+    config_path = tmp_path / ".mcp-config.json"
+    config_path.write_text(json.dumps(config_data))
+    return config_path, dummy_script, config_data
+
+
+@pytest.fixture(params=["cold", "warm"])
+def shared_config(request, shared_config_file):
+    """Get the shared config file, with or without a sidecar to load from.
+
+    Set up for every test, so the load path a test takes never depends on
+    which tests ran before it.
+    """
+    config_path = shared_config_file[0]
+    sidecar_path = ConfigManager(str(config_path))._sidecar_path
+    if request.param == "cold":
+        # Parse and validate the JSON file from scratch
+        sidecar_path.unlink(missing_ok=True)
+        config_module._build_script_config.cache_clear()
+    elif not sidecar_path.exists():
+        ConfigManager(str(config_path)).load_config()
+    return shared_config_file
+
+
+def _check_load_existing_config(manager, script_path, config_data):
+    """Loading an existing configuration file."""
+    config = manager.load_config()
+
+    assert config.working_directory == config_data["working_directory"]
+    assert "test1" in config.scripts
+    assert config.scripts["test1"].name == "test1"
+    assert config.scripts["test1"].path == str(script_path)
+
+
+def _check_get_script_config(manager, script_path, config_data):
+    """Getting script configuration by name."""
+    manager.load_config()
+
+    script_config = manager.get_script_config("test1")
+    assert script_config is not None
+    assert script_config.name == "test1"
+
+    # Test nonexistent script
+    assert manager.get_script_config("nonexistent") is None
+
+
+def _check_list_scripts(manager, script_path, config_data):
+    """Listing available scripts."""
+    manager.load_config()
+
+    scripts = manager.list_scripts()
+    assert len(scripts) == 2
+    assert "test1" in scripts
+    assert "test2" in scripts
+    assert manager.list_scripts() is scripts
 
 
 class TestScriptConfig:
     """Test ScriptConfig validation."""
 
-    def test_valid_script_config(self, tmp_path):
+    def test_valid_script_config(self, dummy_script):
         """Test creating a valid script configuration."""
-        # Create a test script file
-        script_path = tmp_path / "test_script.sh"
-        script_path.write_text("#!/bin/bash\necho 'test'")
+        script = str(dummy_script)
 
         config = ScriptConfig(
             name="test",
-            path=str(script_path),
+            path=script,
             description="Test script",
             arguments=["arg1", "arg2"],
             timeout=60
         )
 
         assert config.name == "test"
-        assert config.path == str(script_path)
+        assert config.path == script
         assert config.description == "Test script"
         assert config.arguments == ["arg1", "arg2"]
         assert config.timeout == 60
 
     def test_nonexistent_script_path(self):
         """Test that nonexistent script path raises ValueError."""
+        config = ScriptConfig(
+            name="test",
+            path="/nonexistent/path.sh",
+            description="Test script"
+        )
+
         with pytest.raises(ValueError, match="Script path does not exist"):
-            ScriptConfig(
-                name="test",
-                path="/nonexistent/path.sh",
-                description="Test script"
-            )
+            config.validate_path()
 
 
 class TestMCPConfig:
@@ -49,14 +150,15 @@ class TestMCPConfig:
 
     def test_valid_config(self, tmp_path):
         """Test creating a valid MCP configuration."""
+        working_dir = str(tmp_path)
         config = MCPConfig(
-            working_directory=str(tmp_path),
+            working_directory=working_dir,
             docker_image="ubuntu:22.04",
             container_name="test-container",
             mount_path="/workspace"
         )
 
-        assert config.working_directory == str(tmp_path)
+        assert config.working_directory == working_dir
         assert config.docker_image == "ubuntu:22.04"
         assert config.container_name == "test-container"
         assert config.mount_path == "/workspace"
@@ -71,6 +173,41 @@ class TestMCPConfig:
                 mount_path="/workspace"
             )
 
+    def test_working_directory_is_checked_each_time(self, tmp_path):
+        """Test that a directory created after a failed check is accepted."""
+        working_dir = tmp_path / "later"
+        with pytest.raises(ValueError, match="Working directory does not exist"):
+            MCPConfig(working_directory=str(working_dir))
+
+        working_dir.mkdir()
+        assert MCPConfig(working_directory=str(working_dir)).working_directory == str(working_dir)
+
+    @pytest.mark.parametrize("docker_image", [
+        "ubuntu",
+        "library/ubuntu:22.04",
+        "localhost:5000/team/app:1.0",
+        "python@sha256:" + "a" * 64,
+    ])
+    def test_valid_docker_image(self, tmp_path, docker_image):
+        """Test that registry hosts, ports, tags and digests are accepted."""
+        config = MCPConfig(working_directory=str(tmp_path), docker_image=docker_image)
+        assert config.docker_image == docker_image
+
+    @pytest.mark.parametrize("field, value, message", [
+        ("docker_image", "Ubuntu:22.04", "Invalid Docker image reference"),
+        ("docker_image", "ubuntu:22.04\n", "Invalid Docker image reference"),
+        ("mount_path", "workspace", "Mount path must be an absolute path"),
+    ])
+    def test_invalid_settings(self, tmp_path, field, value, message):
+        """Test that malformed settings are rejected, also when loaded from a file."""
+        with pytest.raises(ValueError, match=message):
+            MCPConfig(working_directory=str(tmp_path), **{field: value})
+
+        config_path = tmp_path / ".mcp-config.json"
+        config_path.write_text(json.dumps({**_make_config(tmp_path, {}), field: value}))
+        with pytest.raises(ValueError, match=message):
+            ConfigManager(str(config_path)).load_config()
+
 
 class TestConfigManager:
     """Test ConfigManager functionality."""
@@ -79,117 +216,484 @@ class TestConfigManager:
         """Test that loading config creates default when file doesn't exist."""
         config_path = tmp_path / ".mcp-config.json"
 
-        with patch('os.path.exists', return_value=True):
-            manager = ConfigManager(str(config_path))
-            config = manager.load_config()
+        manager = ConfigManager(str(config_path))
+        config = manager.load_config()
 
+        assert config_path.exists()
         assert isinstance(config, MCPConfig)
         assert config.working_directory == "."
         assert config.docker_image == "ubuntu:22.04"
 
-    def test_load_existing_config(self, tmp_path):
-        """Test loading an existing configuration file."""
+    @pytest.mark.parametrize(
+        "scenario",
+        [_check_load_existing_config, _check_get_script_config, _check_list_scripts],
+        ids=["load_existing_config", "get_script_config", "list_scripts"],
+    )
+    def test_config_behaviors(self, shared_config, scenario):
+        """Test reading the shared configuration file."""
+        config_path, script_path, config_data = shared_config
+        scenario(ConfigManager(str(config_path)), script_path, config_data)
+
+    def test_reload_skips_validation_for_unchanged_entries(self, tmp_path, dummy_script):
+        """Test that reloading reuses entries validated by an earlier load."""
         config_path = tmp_path / ".mcp-config.json"
-        script_path = tmp_path / "test.sh"
-        script_path.write_text("#!/bin/bash\necho 'test'")
+        script = str(dummy_script)
 
-        config_data = {
-            "working_directory": str(tmp_path),
-            "scripts": {
-                "test": {
-                    "name": "test",
-                    "path": str(script_path),
-                    "description": "Test script",
-                    "arguments": [],
-                    "timeout": 30
-                }
-            },
-            "docker_image": "ubuntu:22.04",
-            "container_name": "test-container",
-            "mount_path": "/workspace"
-        }
+        config_data = _make_config(tmp_path, {
+            "test": {
+                "name": "test",
+                "path": script,
+                "description": "Test script",
+                "arguments": [],
+                "timeout": 30
+            }
+        })
 
-        with open(config_path, 'w') as f:
-            json.dump(config_data, f)
+        config_path.write_text(json.dumps(config_data))
 
         manager = ConfigManager(str(config_path))
-        config = manager.load_config()
+        first = manager.load_config()
+
+        # The entry was validated on first load, so it is trusted on reload
+        # even once the file has to be read again
+        config_data["mount_path"] = "/src"
+        config_path.write_text(json.dumps(config_data))
+        os.utime(config_path, ns=(0, 0))
+        with patch("mcp_script_runner.config._build_script_config",
+                   side_effect=AssertionError("entry revalidated")):
+            with patch.object(ScriptConfig, "model_validate",
+                              side_effect=AssertionError("entry revalidated")):
+                config = manager.reload_config()
+        assert config.mount_path == "/src"
+        assert config.scripts["test"] is first.scripts["test"]
+        assert config.scripts["test"].path == script
+
+        # A changed entry is validated again
+        config_data["scripts"]["test"]["timeout"] = "soon"
+        config_path.write_text(json.dumps(config_data))
+
+        with pytest.raises(ValueError, match="Failed to load configuration"):
+            manager.reload_config()
+
+    def test_validated_entries_are_shared_between_managers(self, tmp_path, dummy_script):
+        """Test that an unchanged script entry is only validated once."""
+        config_path = tmp_path / ".mcp-config.json"
+
+        config_data = _make_config(tmp_path, {
+            "test": {
+                "name": "test",
+                "path": str(dummy_script),
+                "arguments": ["arg1"]
+            }
+        })
+
+        config_path.write_text(json.dumps(config_data))
+
+        first = ConfigManager(str(config_path)).load_config()
+        # Without the sidecar, the second manager validates the file again
+        ConfigManager(str(config_path))._sidecar_path.unlink()
+        second = ConfigManager(str(config_path)).load_config()
+        assert first.scripts["test"] is second.scripts["test"]
+        assert second.scripts["test"].arguments == ["arg1"]
+
+    def test_resolve_working_directory(self, tmp_path, dummy_script):
+        """Test resolving script working directories against the config."""
+        config_path = tmp_path / ".mcp-config.json"
+        script = str(dummy_script)
+        script_dir = tmp_path / "script_dir"
+        script_dir.mkdir()
+        other_dir = tmp_path / "other_dir"
+        other_dir.mkdir()
+
+        config_data = _make_config(tmp_path, {
+            "default": {"name": "default", "path": script},
+            "custom": {
+                "name": "custom",
+                "path": script,
+                "working_directory": str(script_dir)
+            }
+        })
+
+        config_path.write_text(json.dumps(config_data))
 
+        manager = ConfigManager(str(config_path))
+        manager.load_config()
+        default = manager.get_script_config("default")
+        custom = manager.get_script_config("custom")
+
+        assert manager.resolve_working_directory(default) == str(tmp_path.resolve())
+        assert manager.resolve_working_directory(custom) == str(script_dir.resolve())
+
+        # Overriding the default only affects scripts without their own directory
+        manager.set_working_directory(str(other_dir))
+        assert manager.resolve_working_directory(default) == str(other_dir.resolve())
+        assert manager.resolve_working_directory(custom) == str(script_dir.resolve())
+
+    def test_list_scripts_by_prefix(self, tmp_path, dummy_script):
+        """Test listing scripts nested below a namespace."""
+        config_path = tmp_path / ".mcp-config.json"
+
+        names = ["build/frontend/test", "build/backend", "buildx", "deploy/prod"]
+        config_data = _make_config(tmp_path, {
+            name: {"name": name, "path": str(dummy_script)} for name in names
+        })
+
+        config_path.write_text(json.dumps(config_data))
+
+        manager = ConfigManager(str(config_path))
+        manager.load_config()
+
+        assert manager.list_scripts() == tuple(names)
+        assert manager.list_scripts("build/") == ("build/frontend/test", "build/backend")
+        assert manager.list_scripts("build/frontend") == ("build/frontend/test",)
+        assert manager.list_scripts("missing") == ()
+        assert manager.get_script_config("build/backend").name == "build/backend"
+        assert manager.get_script_config("build") is None
+
+    def test_list_scripts_by_prefix_keeps_configured_order(self, tmp_path, dummy_script):
+        """Test that namespace listings are not regrouped by namespace."""
+        config_path = tmp_path / ".mcp-config.json"
+        names = ["a/x", "b", "a/y", "a"]
+        config_data = _make_config(tmp_path, {
+            name: {"name": name, "path": str(dummy_script)} for name in names
+        })
+        config_path.write_text(json.dumps(config_data))
+
+        manager = ConfigManager(str(config_path))
+        assert manager.list_scripts("a") == ("a/x", "a/y", "a")
+        assert manager.list_scripts("") == tuple(names)
+        assert manager.list_scripts("/") is manager.list_scripts()
+
+    def test_reload_unchanged_file_skips_read(self, tmp_path):
+        """Test that reloading an untouched file does not read it again."""
+        config_path = tmp_path / ".mcp-config.json"
+        other_dir = tmp_path / "other_dir"
+        other_dir.mkdir()
+
+        config_path.write_text(json.dumps(_make_config(tmp_path, {})))
+
+        manager = ConfigManager(str(config_path))
+        manager.load_config()
+        manager.set_working_directory(str(other_dir))
+
+        with patch("mcp_script_runner.config._read_file", side_effect=AssertionError("file re-read")):
+            config = manager.reload_config()
+
+        # The reload still discards in-memory overrides
         assert config.working_directory == str(tmp_path)
-        assert "test" in config.scripts
-        assert config.scripts["test"].name == "test"
 
-    def test_get_script_config(self, tmp_path):
-        """Test getting script configuration by name."""
+    def test_load_config_rejects_invalid_field_types(self, tmp_path, dummy_script):
+        """Test that script entries with wrongly typed fields are rejected."""
+        config_path = tmp_path / ".mcp-config.json"
+
+        config_data = _make_config(tmp_path, {
+            "test": {"name": "test", "path": str(dummy_script), "timeout": "soon"}
+        })
+
+        config_path.write_text(json.dumps(config_data))
+
+        with pytest.raises(ValueError, match="Failed to load configuration"):
+            ConfigManager(str(config_path)).load_config()
+
+    @pytest.mark.parametrize("prior", [None, 1], ids=["fresh", "after-int"])
+    @pytest.mark.parametrize("field, value, expected", [
+        ("timeout", 1, 1),
+        ("timeout", True, 1),
+        ("timeout", 1.0, 1),
+        ("timeout", "30", 30),
+        ("timeout", " 30 ", 30),
+        ("timeout", 1.5, None),
+        ("timeout", "1e3", None),
+        ("nice", True, 1),
+        ("cpu_set", [True], [1]),
+        ("cpu_set", ["1"], [1]),
+    ])
+    def test_load_config_coerces_like_pydantic(self, tmp_path, dummy_script, field, value, expected, prior):
+        """Test that lax type coercion matches pydantic's, whatever was loaded before."""
+        config_module._build_script_config.cache_clear()
+        if prior is not None:
+            # Equal values of other types must not share validation results
+            prior_path = tmp_path / "prior.json"
+            prior_value = [prior] if field == "cpu_set" else prior
+            prior_path.write_text(json.dumps(_make_config(tmp_path, {
+                "test": {"name": "test", "path": str(dummy_script), field: prior_value}
+            })))
+            ConfigManager(str(prior_path)).load_config()
+
+        config_path = tmp_path / ".mcp-config.json"
+        config_path.write_text(json.dumps(_make_config(tmp_path, {
+            "test": {"name": "test", "path": str(dummy_script), field: value}
+        })))
+
+        if expected is None:
+            with pytest.raises(ValueError, match="Failed to load configuration"):
+                ConfigManager(str(config_path)).load_config()
+            return
+        script = ConfigManager(str(config_path)).load_config().scripts["test"]
+        assert getattr(script, field) == expected
+        assert type(getattr(script, field)) is type(expected)
+        assert script.arguments == []
+
+    def test_load_config_rejects_unknown_fields(self, tmp_path, dummy_script):
+        """Test that misspelled or unknown script fields are rejected."""
+        config_path = tmp_path / ".mcp-config.json"
+
+        config_data = _make_config(tmp_path, {
+            "test": {"name": "test", "path": str(dummy_script), "timeuot": 30}
+        })
+
+        config_path.write_text(json.dumps(config_data))
+
+        with pytest.raises(ValueError, match="Failed to load configuration"):
+            ConfigManager(str(config_path)).load_config()
+
+    def test_load_config_reuses_instance_until_file_changes(self, tmp_path):
+        """Test that an unchanged file yields the same config instance."""
+        config_path = tmp_path / ".mcp-config.json"
+
+        config_path.write_text(json.dumps(_make_config(tmp_path, {})))
+
+        manager = ConfigManager(str(config_path))
+        first = manager.load_config()
+        assert manager.load_config() is first
+
+        config_path.write_text(json.dumps({**_make_config(tmp_path, {}), "mount_path": "/src"}))
+
+        changed = manager.load_config()
+        assert changed is not first
+        assert changed.mount_path == "/src"
+
+    def test_missing_script_path_is_reported_on_use(self, tmp_path):
+        """Test that a missing script file only fails when the script is used."""
+        config_path = tmp_path / ".mcp-config.json"
+
+        config_data = _make_config(tmp_path, {
+            "missing": {"name": "missing", "path": str(tmp_path / "missing.sh")}
+        })
+
+        config_path.write_text(json.dumps(config_data))
+
+        manager = ConfigManager(str(config_path))
+        manager.load_config()
+        assert manager.list_scripts() == ("missing",)
+
+        with pytest.raises(ValueError, match="Script path does not exist"):
+            manager.get_script_config("missing")
+
+    def test_reload_reuses_unchanged_script_instances(self, tmp_path, dummy_script):
+        """Test that editing one script entry leaves the others untouched."""
+        config_path = tmp_path / ".mcp-config.json"
+        script = str(dummy_script)
+
+        config_data = _make_config(tmp_path, {
+            "kept": {"name": "kept", "path": script},
+            "edited": {"name": "edited", "path": script}
+        })
+
+        config_path.write_text(json.dumps(config_data))
+
+        manager = ConfigManager(str(config_path))
+        first = manager.load_config()
+
+        config_data["scripts"]["edited"]["timeout"] = 10
+        config_path.write_text(json.dumps(config_data))
+
+        second = manager.reload_config()
+        assert second.scripts["kept"] is first.scripts["kept"]
+        assert second.scripts["edited"].timeout == 10
+
+    def test_get_script_config_reuses_compact_copies(self, tmp_path, dummy_script):
+        """Test that lookups return compact copies rebuilt only for changed entries."""
+        config_path = tmp_path / ".mcp-config.json"
+        config_data = _make_config(tmp_path, {
+            "kept": {"name": "kept", "path": str(dummy_script), "arguments": ["a"]},
+            "edited": {"name": "edited", "path": str(dummy_script)}
+        })
+        config_path.write_text(json.dumps(config_data))
+
+        manager = ConfigManager(str(config_path))
+        kept = manager.get_script_config("kept")
+        edited = manager.get_script_config("edited")
+        assert isinstance(kept, ScriptConfigFast)
+        assert kept.arguments == ("a",)
+
+        config_data["scripts"]["edited"]["timeout"] = 10
+        config_path.write_text(json.dumps(config_data))
+        os.utime(config_path, ns=(0, 0))
+        manager.load_config()
+
+        assert manager.get_script_config("kept") is kept
+        assert manager.get_script_config("edited") is not edited
+        assert manager.get_script_config("edited").timeout == 10
+
+    def test_script_paths_are_checked_from_directory_listing(self, tmp_path):
+        """Test that scripts sharing a directory are checked with one listing."""
+        config_path = tmp_path / ".mcp-config.json"
+        scripts_dir = tmp_path / "scripts"
+        scripts_dir.mkdir()
+        names = ["one", "two", "three"]
+        for name in names:
+            (scripts_dir / f"{name}.sh").write_text("#!/bin/bash\necho 'test'")
+        (scripts_dir / "dangling.sh").symlink_to(tmp_path / "gone.sh")
+
+        config_data = _make_config(tmp_path, {
+            name: {"name": name, "path": str(scripts_dir / f"{name}.sh")}
+            for name in names + ["dangling", "missing"]
+        })
+        config_path.write_text(json.dumps(config_data))
+
+        manager = ConfigManager(str(config_path))
+        manager.load_config()
+        with patch("os.stat", side_effect=AssertionError("script stat-ed")):
+            for name in names:
+                assert manager.get_script_config(name).name == name
+
+        # Misses and symlinks are confirmed with a stat
+        for name in ("missing", "dangling"):
+            with pytest.raises(ValueError, match="Script path does not exist"):
+                manager.get_script_config(name)
+
+    def test_reload_rechecks_script_paths(self, tmp_path):
+        """Test that a script created after a failed lookup is found on reload."""
+        config_path = tmp_path / ".mcp-config.json"
+        script_path = tmp_path / "late.sh"
+
+        config_data = _make_config(tmp_path, {"late": {"name": "late", "path": str(script_path)}})
+
+        config_path.write_text(json.dumps(config_data))
+
+        manager = ConfigManager(str(config_path))
+        manager.load_config()
+        with pytest.raises(ValueError, match="Script path does not exist"):
+            manager.get_script_config("late")
+
+        script_path.write_text("#!/bin/bash\necho 'late'")
+        manager.reload_config()
+        assert manager.get_script_config("late").name == "late"
+
+    def test_trusted_load_skips_validation(self, tmp_path):
+        """Test that a trusted load builds the config without validating it."""
         config_path = tmp_path / ".mcp-config.json"
-        script_path = tmp_path / "test.sh"
-        script_path.write_text("#!/bin/bash\necho 'test'")
 
         config_data = {
-            "working_directory": str(tmp_path),
-            "scripts": {
-                "test": {
-                    "name": "test",
-                    "path": str(script_path),
-                    "description": "Test script",
-                    "arguments": [],
-                    "timeout": 30
-                }
-            },
-            "docker_image": "ubuntu:22.04",
-            "container_name": "test-container",
-            "mount_path": "/workspace"
+            "working_directory": "/nonexistent/path",
+            "scripts": {"test": {"name": "test", "path": "/nonexistent/path.sh", "timeout": 5}}
         }
 
-        with open(config_path, 'w') as f:
-            json.dump(config_data, f)
+        config_path.write_text(json.dumps(config_data))
+
+        config = ConfigManager(str(config_path)).load_config(trusted=True)
+        assert config.working_directory == "/nonexistent/path"
+        assert config.scripts["test"].timeout == 5
+        assert config.docker_image == "ubuntu:22.04"
+
+        with pytest.raises(ValueError, match="Working directory does not exist"):
+            ConfigManager(str(config_path)).load_config()
+
+    def test_trusted_load_is_not_a_validation_baseline(self, tmp_path, dummy_script):
+        """Test that entries from a trusted load are validated by later untrusted loads."""
+        config_path = tmp_path / ".mcp-config.json"
+        config_data = _make_config(tmp_path, {
+            "test": {"name": "test", "path": str(dummy_script), "timeout": "soon"}
+        })
+        config_path.write_text(json.dumps(config_data))
 
         manager = ConfigManager(str(config_path))
-        manager.load_config()
+        manager.load_config(trusted=True)
 
-        script_config = manager.get_script_config("test")
-        assert script_config is not None
-        assert script_config.name == "test"
+        # Neither the unchanged file nor an edit elsewhere in it is trusted
+        with pytest.raises(ValueError, match="Failed to load configuration"):
+            manager.load_config()
 
-        # Test nonexistent script
-        assert manager.get_script_config("nonexistent") is None
+        config_data["mount_path"] = "/src"
+        config_path.write_text(json.dumps(config_data))
+        os.utime(config_path, ns=(0, 0))
+        with pytest.raises(ValueError, match="Failed to load configuration"):
+            manager.load_config()
 
-    def test_list_scripts(self, tmp_path):
-        """Test listing available scripts."""
+    def test_list_script_configs(self, shared_config):
+        """Test listing compact script configurations."""
+        config_path, script_path, _ = shared_config
+
+        manager = ConfigManager(str(config_path))
+        script_configs = manager.list_script_configs()
+
+        assert [s.name for s in script_configs] == ["test1", "test2"]
+        assert script_configs[0].path == str(script_path)
+        assert script_configs[0].arguments == ()
+        assert manager.list_script_configs() is script_configs
+        with pytest.raises(AttributeError):
+            script_configs[0].timeout = 10
+
+    def test_load_config_reuses_sidecar_until_file_changes(self, tmp_path, dummy_script):
+        """Test that a new manager loads the pickled config of an unchanged file."""
         config_path = tmp_path / ".mcp-config.json"
-        script_path = tmp_path / "test.sh"
-        script_path.write_text("#!/bin/bash\necho 'test'")
 
+        config_data = _make_config(tmp_path, {
+            "test": {"name": "test", "path": str(dummy_script), "timeout": 30}
+        })
+
+        config_path.write_text(json.dumps(config_data))
+
+        ConfigManager(str(config_path)).load_config()
+        assert ConfigManager(str(config_path))._sidecar_path.exists()
+        assert not (tmp_path / ".mcp-config.json.cache.pkl").exists()
+
+        with patch("mcp_script_runner.config._loads", side_effect=AssertionError("file parsed")):
+            config = ConfigManager(str(config_path)).load_config()
+        assert config.scripts["test"].timeout == 30
+
+        config_data["scripts"]["test"]["timeout"] = 60
+        config_path.write_text(json.dumps(config_data))
+        os.utime(config_path, ns=(0, 0))
+
+        config = ConfigManager(str(config_path)).load_config()
+        assert config.scripts["test"].timeout == 60
+
+    def test_trusted_load_does_not_write_sidecar(self, tmp_path):
+        """Test that unvalidated configs are never handed to other processes."""
+        config_path = tmp_path / ".mcp-config.json"
         config_data = {
-            "working_directory": str(tmp_path),
-            "scripts": {
-                "test1": {
-                    "name": "test1",
-                    "path": str(script_path),
-                    "description": "Test script 1",
-                    "arguments": [],
-                    "timeout": 30
-                },
-                "test2": {
-                    "name": "test2",
-                    "path": str(script_path),
-                    "description": "Test script 2",
-                    "arguments": [],
-                    "timeout": 30
-                }
-            },
-            "docker_image": "ubuntu:22.04",
-            "container_name": "test-container",
-            "mount_path": "/workspace"
+            **_make_config(tmp_path, {"test": {"name": "test", "path": "x", "timeout": "soon"}}),
+            "docker_image": "NOT VALID!!"
         }
+        config_path.write_text(json.dumps(config_data))
+
+        manager = ConfigManager(str(config_path))
+        manager.load_config(trusted=True)
+        assert not manager._sidecar_path.exists()
 
-        with open(config_path, 'w') as f:
-            json.dump(config_data, f)
+        with pytest.raises(ValueError, match="Failed to load configuration"):
+            ConfigManager(str(config_path)).load_config()
 
+    @pytest.mark.parametrize("tamper", ["format", "mode"])
+    def test_load_config_ignores_unusable_sidecar(self, tmp_path, tamper):
+        """Test that sidecars from other model versions or writers are not used."""
+        config_path = tmp_path / ".mcp-config.json"
+        config_path.write_text(json.dumps(_make_config(tmp_path, {})))
         manager = ConfigManager(str(config_path))
         manager.load_config()
 
-        scripts = manager.list_scripts()
-        assert len(scripts) == 2
-        assert "test1" in scripts
-        assert "test2" in scripts
\ No newline at end of file
+        sidecar_path = manager._sidecar_path
+        entry = pickle.loads(sidecar_path.read_bytes())
+        if tamper == "format":
+            sidecar_path.write_bytes(pickle.dumps(((0,),) + entry[1:]))
+        else:
+            sidecar_path.chmod(0o666)
+
+        with patch("mcp_script_runner.config.pickle.loads",
+                   side_effect=AssertionError("sidecar used")) if tamper == "mode" else nullcontext():
+            with patch("mcp_script_runner.config._loads", wraps=json.loads) as loads:
+                ConfigManager(str(config_path)).load_config()
+        assert loads.called
+
+    def test_load_config_coerces_integral_floats(self, tmp_path, dummy_script):
+        """Test that integral floats are stored as ints, like pydantic does."""
+        config_path = tmp_path / ".mcp-config.json"
+        config_path.write_text(json.dumps(_make_config(tmp_path, {
+            "test": {"name": "test", "path": str(dummy_script), "timeout": 30.0, "cpu_set": [0.0]}
+        })))
+
+        script = ConfigManager(str(config_path)).load_config().scripts["test"]
+        assert type(script.timeout) is int and script.timeout == 30
+        assert [type(cpu) for cpu in script.cpu_set] == [int]
@@ -0,0 +1,86 @@
+"""Tests for script execution."""
+
+import asyncio
+import json
+import os
+import subprocess
+
+import pytest
+
+from mcp_script_runner import executor
+from mcp_script_runner.config import ConfigManager, ScriptConfigFast
+from mcp_script_runner.executor import ScriptExecutor
+
+
+def _make_manager(tmp_path, script_body, **fields):
+    """Write a config with a single script named "test"."""
+    script_path = tmp_path / "test.sh"
+    script_path.write_text(f"#!/bin/bash\n{script_body}\n")
+    config_path = tmp_path / ".mcp-config.json"
+    config_path.write_text(json.dumps({
+        "working_directory": str(tmp_path),
+        "scripts": {"test": {"name": "test", "path": str(script_path), **fields}}
+    }))
+    return ConfigManager(str(config_path))
+
+
+def _fast_config(**fields):
+    """Build a compact script config for a script that is never executed."""
+    defaults = {
+        "name": "test", "path": "/bin/true", "description": "", "arguments": (),
+        "working_directory": None, "timeout": 30, "cpu_set": None, "nice": None
+    }
+    return ScriptConfigFast(**{**defaults, **fields})
+
+
+class TestScheduling:
+    """Test applying cpu_set and nice to script processes."""
+
+    def test_scheduling_fields_are_loaded(self, tmp_path):
+        """Test that cpu_set and nice are read from the config file."""
+        manager = _make_manager(tmp_path, "true", cpu_set=[0], nice=5)
+
+        script_config = manager.get_script_config("test")
+        assert script_config.cpu_set == (0,)
+        assert script_config.nice == 5
+
+    @pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="Linux only")
+    def test_apply_scheduling(self):
+        """Test that affinity and niceness are applied to a running process."""
+        process = subprocess.Popen(["sleep", "30"])
+        try:
+            executor._apply_scheduling(process.pid, _fast_config(cpu_set=(0,), nice=1))
+            assert os.sched_getaffinity(process.pid) == {0}
+            assert os.getpriority(os.PRIO_PROCESS, process.pid) == os.getpriority(os.PRIO_PROCESS, 0) + 1
+        finally:
+            process.kill()
+            process.wait()
+
+    @pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="Linux only")
+    def test_apply_scheduling_ignores_invalid_values(self, caplog):
+        """Test that scheduling values the OS rejects only log a warning."""
+        process = subprocess.Popen(["sleep", "30"])
+        try:
+            executor._apply_scheduling(process.pid, _fast_config(cpu_set=(0.0,)))
+            executor._apply_scheduling(process.pid, _fast_config(cpu_set=(-1,)))
+        finally:
+            process.kill()
+            process.wait()
+        assert caplog.text.count("Could not apply scheduling") == 2
+
+    def test_failed_run_does_not_leave_script_running(self, tmp_path, monkeypatch):
+        """Test that an error after spawning kills and reaps the script."""
+        manager = _make_manager(tmp_path, "exec sleep 30", nice=1)
+        pids = []
+
+        def fail(pid, script_config):
+            pids.append(pid)
+            raise RuntimeError("scheduling broke")
+
+        monkeypatch.setattr(executor, "_apply_scheduling", fail)
+        result = asyncio.run(ScriptExecutor(manager).execute_script("test"))
+
+        assert result.exit_code == 1
+        assert "scheduling broke" in result.stderr
+        with pytest.raises(ProcessLookupError):
+            os.kill(pids[0], 0)